@@ -1,62 +1,120 @@
-import customtkinter as ctk
-from tkinter import filedialog, messagebox, colorchooser
-import random, time, threading, matplotlib.pyplot as plt, os, glob, json, datetime
-from tkinter import END
+import random, time, threading, os, glob, json, datetime, sys, csv, argparse, gc, math, statistics
+import multiprocessing, multiprocessing.connection, operator, heapq, bisect, signal, tempfile, mmap, struct, hashlib, queue, tracemalloc, sqlite3, platform, contextlib
+from itertools import islice
+from collections import OrderedDict
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # the NumPy engine is optional
+    np = None
 
 SETTINGS_FILE = "settings.json"
+END = "end"
+
+# GUI toolkits are imported on first use so headless benchmark runs never pay for them
+ctk = filedialog = messagebox = colorchooser = plt = None
+
+def load_gui():
+    global ctk, filedialog, messagebox, colorchooser
+    import customtkinter as ctk
+    from tkinter import filedialog, messagebox, colorchooser
+
+def load_pyplot():
+    global plt
+    if plt is None:
+        import matplotlib.pyplot as plt
+    return plt
+
+# ----------------- Progress Reporting ----------------- #
+# Algorithms report their own completed fraction; the hook is None unless a scheduler is listening
+PROGRESS_GRAIN = 1024  # partitions smaller than this never report
+_progress_hook = None
+
+def set_progress_hook(hook):
+    global _progress_hook
+    _progress_hook = hook
+
+def report_progress(frac):
+    if _progress_hook is not None:
+        _progress_hook(frac)
 
 # ----------------- Sorting Algorithms ----------------- #
+# Each sort returns a sorted copy; its .inplace entry point may reuse (and clobber) the list it is given,
+# so the timing harness hands it a copy made outside the timed window.
 def bubble_sort(arr):
-    a = arr.copy()
+    return bubble_sort_inplace(arr.copy())
+
+def bubble_sort_inplace(a):
     for i in range(len(a)):
+        report_progress(1 - (1 - i / len(a)) ** 2)
         for j in range(len(a) - i - 1):
             if a[j] > a[j + 1]:
                 a[j], a[j + 1] = a[j + 1], a[j]
     return a
+bubble_sort.inplace = bubble_sort_inplace
 
 def insertion_sort(arr):
-    a = arr.copy()
+    return insertion_sort_inplace(arr.copy())
+
+def insertion_sort_inplace(a):
     for i in range(1, len(a)):
+        if not i % PROGRESS_GRAIN:
+            report_progress((i / len(a)) ** 2)
         key = a[i]; j = i - 1
         while j >= 0 and key < a[j]:
             a[j + 1] = a[j]; j -= 1
         a[j + 1] = key
     return a
+insertion_sort.inplace = insertion_sort_inplace
 
 def selection_sort(arr):
-    a = arr.copy()
+    return selection_sort_inplace(arr.copy())
+
+def selection_sort_inplace(a):
     for i in range(len(a)):
+        report_progress(1 - (1 - i / len(a)) ** 2)
         min_idx = i
         for j in range(i + 1, len(a)):
             if a[j] < a[min_idx]:
                 min_idx = j
         a[i], a[min_idx] = a[min_idx], a[i]
     return a
+selection_sort.inplace = selection_sort_inplace
+
+MERGE_RUN = 16  # bottom-up merge sort starts from insertion-sorted runs of this length
 
 def merge_sort(arr):
-    if len(arr) > 1:
-        mid = len(arr)//2
-        L, R = merge_sort(arr[:mid]), merge_sort(arr[mid:])
-        return merge_merge(L, R)
-    return arr
-
-def merge_merge(left, right):
-    result, i, j = [], 0, 0
-    while i < len(left) and j < len(right):
-        if left[i] < right[j]:
-            result.append(left[i]); i += 1
-        else:
-            result.append(right[j]); j += 1
-    result.extend(left[i:]); result.extend(right[j:])
-    return result
+    return merge_sort_inplace(arr.copy())
+
+def merge_sort_inplace(src):
+    # Bottom-up: one scratch buffer allocated up front, each level merges src into dst and swaps
+    n = len(src)
+    for lo in range(0, n, MERGE_RUN):
+        insertion_range(src, lo, min(lo + MERGE_RUN, n))
+    dst, width, levels = src.copy(), MERGE_RUN, max(1, (n - 1) // MERGE_RUN).bit_length()
+    while width < n:
+        report_progress((width // MERGE_RUN).bit_length() / (levels + 1))
+        for lo in range(0, n, 2 * width):
+            merge_into(src, dst, lo, min(lo + width, n), min(lo + 2 * width, n))
+        src, dst, width = dst, src, width * 2
+    return src
+merge_sort.inplace = merge_sort_inplace
 
 def quick_sort(arr):
-    a = arr.copy()
+    return quick_sort_inplace(arr.copy())
+
+def quick_sort_inplace(a):
     quick_rec(a, 0, len(a)-1)
     return a
+quick_sort.inplace = quick_sort_inplace
 
 def quick_rec(arr, low, high):
     if low < high:
+        if high - low > PROGRESS_GRAIN:
+            report_progress(low / len(arr))  # left subtrees finish first, so everything below low is sorted
         pi = quick_partition(arr, low, high)
         quick_rec(arr, low, pi-1)
         quick_rec(arr, pi+1, high)
@@ -69,14 +127,44 @@ def quick_partition(arr, low, high):
     arr[i+1], arr[high] = arr[high], arr[i+1]
     return i+1
 
+SIGN64, MASK64 = 1 << 63, (1 << 64) - 1
+
+def radix_keys(a):
+    # Order-preserving map onto non-negative ints plus its inverse (None when a already qualifies):
+    # ints are offset by the minimum, floats use their IEEE-754 bits with the sign bit flipped
+    # (all bits for negatives, so larger magnitudes sort first). Keys keep a's container type, so
+    # counting lists still see every write.
+    keep = type(a)
+    if any(isinstance(x, float) for x in a):
+        bits = struct.unpack(f"<{len(a)}Q", struct.pack(f"<{len(a)}d", *a))
+        def restore(keys):
+            bits = [k ^ SIGN64 if k & SIGN64 else k ^ MASK64 for k in keys]
+            return list(struct.unpack(f"<{len(bits)}d", struct.pack(f"<{len(bits)}Q", *bits)))
+        return keep(b ^ MASK64 if b & SIGN64 else b | SIGN64 for b in bits), restore
+    low = min(a)
+    if low >= 0:
+        return a, None
+    return keep(x - low for x in a), lambda keys: [k + low for k in keys]
+
 def radix_sort(arr):
-    a = arr.copy(); max_num, exp = max(a), 1
+    return radix_sort_inplace(arr.copy())
+
+def radix_sort_inplace(a):
+    if not a:
+        return a
+    a, restore = radix_keys(a)
+    # Digit passes ping-pong between a and one scratch buffer instead of copying back
+    max_num, exp, buf = max(a), 1, a.copy()
+    digits = len(str(max_num))
     while max_num // exp > 0:
-        counting_sort(a, exp); exp *= 10
-    return a
+        report_progress(len(str(exp)) / (digits + 1))
+        a, buf = counting_sort(a, exp, buf), a; exp *= 10
+    return restore(a) if restore else a
+radix_sort.inplace = radix_sort_inplace
 
-def counting_sort(arr, exp):
-    n, output, count = len(arr), [0]*len(arr), [0]*10
+def counting_sort(arr, exp, output=None):
+    n, count = len(arr), [0]*10
+    output = arr.copy() if output is None else output
     for i in range(n):
         index = arr[i] // exp
         count[index % 10] += 1
@@ -88,8 +176,232 @@ def counting_sort(arr, exp):
         output[count[index % 10]-1] = arr[i]
         count[index % 10] -= 1
         i -= 1
-    for i in range(n):
-        arr[i] = output[i]
+    return output
+
+HYBRID_SMALL = 16     # slices this short go to insertion sort
+HYBRID_NINTHER = 128  # slices this long pick the pivot as a median of medians
+HYBRID_MIN_RUN = 32   # average run length that makes run merging worthwhile
+
+def hybrid_sort(arr):
+    return hybrid_sort_inplace(arr.copy())
+
+def hybrid_sort_inplace(a):
+    n = len(a)
+    if n < 2:
+        return a
+    bounds = find_runs(a, n // HYBRID_MIN_RUN)
+    if bounds is not None:
+        return merge_runs(a, bounds)
+    introsort(a, 0, n, 2 * n.bit_length())
+    return a
+hybrid_sort.inplace = hybrid_sort_inplace
+
+def find_runs(a, max_runs):
+    # Timsort-style scan: ascending runs kept, strictly descending runs reversed in place.
+    # Gives up (None) as soon as the input has too many runs, so random data costs little.
+    n, i, bounds = len(a), 0, [0]
+    while i < n:
+        j = i + 1
+        if j < n and a[j] < a[i]:
+            while j + 1 < n and a[j + 1] < a[j]:
+                j += 1
+            lo, hi = i, j
+            while lo < hi:
+                a[lo], a[hi] = a[hi], a[lo]; lo += 1; hi -= 1
+        else:
+            while j < n and not a[j] < a[j - 1]:
+                j += 1
+            j -= 1
+        i = j + 1
+        bounds.append(i)
+        if len(bounds) - 1 > max(1, max_runs):
+            return None
+    return bounds
+
+def merge_into(src, dst, lo, mid, hi):
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]; j += 1
+        else:
+            dst[k] = src[i]; i += 1
+        k += 1
+    # The leftover is copied element by element: a slice would build a temporary list
+    while i < mid:
+        dst[k] = src[i]; i += 1; k += 1
+    while j < hi:
+        dst[k] = src[j]; j += 1; k += 1
+
+def merge_runs(a, bounds):
+    src, dst, levels = a, a.copy(), (len(bounds) - 2).bit_length()
+    while len(bounds) > 2:
+        report_progress(1 - (len(bounds) - 2).bit_length() / (levels + 1))
+        merged = [0]
+        for k in range(0, len(bounds) - 1, 2):
+            lo, mid = bounds[k], bounds[k + 1]
+            hi = bounds[k + 2] if k + 2 < len(bounds) else mid
+            if hi > mid:
+                merge_into(src, dst, lo, mid, hi)
+            else:
+                for k in range(lo, mid):
+                    dst[k] = src[k]
+            merged.append(hi)
+        bounds, src, dst = merged, dst, src
+    return src
+
+def introsort(a, lo, hi, depth):
+    stack, total, settled = [(lo, hi, depth)], hi - lo, 0
+    while stack:
+        lo, hi, depth = stack.pop()
+        while True:
+            if hi - lo <= HYBRID_SMALL:
+                insertion_range(a, lo, hi); settled += hi - lo
+                break
+            if depth == 0:
+                heapsort_range(a, lo, hi); settled += hi - lo
+                break
+            if hi - lo > PROGRESS_GRAIN:
+                report_progress(settled / total)
+            depth -= 1
+            lt, gt = partition3(a, lo, hi, choose_pivot(a, lo, hi))
+            settled += gt - lt
+            # Loop on the smaller side and defer the larger one, keeping the stack O(log n)
+            if lt - lo < hi - gt:
+                stack.append((gt, hi, depth)); hi = lt
+            else:
+                stack.append((lo, lt, depth)); lo = gt
+
+def median3(x, y, z):
+    if x < y:
+        return y if y < z else (z if x < z else x)
+    return x if x < z else (z if y < z else y)
+
+def choose_pivot(a, lo, hi):
+    n, mid = hi - lo, (lo + hi) // 2
+    if n < HYBRID_NINTHER:
+        return median3(a[lo], a[mid], a[hi - 1])
+    s = n // 8
+    return median3(median3(a[lo], a[lo + s], a[lo + 2 * s]),
+                   median3(a[mid - s], a[mid], a[mid + s]),
+                   median3(a[hi - 1 - 2 * s], a[hi - 1 - s], a[hi - 1]))
+
+def partition3(a, lo, hi, pivot):
+    # Dijkstra 3-way partition: a[lo:lt] < pivot, a[lt:gt] == pivot, a[gt:hi] > pivot
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        x = a[i]
+        if x < pivot:
+            a[i] = a[lt]; a[lt] = x; lt += 1; i += 1
+        elif pivot < x:
+            gt -= 1; a[i] = a[gt]; a[gt] = x
+        else:
+            i += 1
+    return lt, gt
+
+def insertion_range(a, lo, hi):
+    for i in range(lo + 1, hi):
+        key = a[i]; j = i - 1
+        while j >= lo and key < a[j]:
+            a[j + 1] = a[j]; j -= 1
+        a[j + 1] = key
+
+def heapsort_range(a, lo, hi):
+    n = hi - lo
+    for start in range(n // 2 - 1, -1, -1):
+        sift_down(a, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        a[lo], a[lo + end] = a[lo + end], a[lo]
+        sift_down(a, lo, 0, end)
+
+def sift_down(a, lo, root, n):
+    while True:
+        child = 2 * root + 1
+        if child >= n:
+            return
+        if child + 1 < n and a[lo + child] < a[lo + child + 1]:
+            child += 1
+        if not a[lo + root] < a[lo + child]:
+            return
+        a[lo + root], a[lo + child] = a[lo + child], a[lo + root]
+        root = child
+
+# ----------------- NumPy Engine ----------------- #
+NP_MERGE_BLOCK = 1 << 15
+
+def as_list(data):
+    return data.tolist() if hasattr(data, "tolist") else list(data)
+
+def to_array(data):
+    # int64, or float64 when the data holds floats; ints wider than 64 bits do not fit
+    a = np.array(data)
+    if a.dtype.kind not in "iuf":
+        raise ValueError("the NumPy engine needs int64 or float64 values")
+    return a.astype(np.float64 if a.dtype.kind == "f" else np.int64, copy=False)
+
+def np_quick_sort(arr):
+    return np.sort(np.asarray(arr), kind="quicksort")
+
+def np_quick_sort_inplace(a):
+    a.sort(kind="quicksort")
+    return a
+np_quick_sort.inplace = np_quick_sort_inplace
+
+def np_stable_sort(arr):
+    return np.sort(np.asarray(arr), kind="stable")
+
+def np_stable_sort_inplace(a):
+    a.sort(kind="stable")
+    return a
+np_stable_sort.inplace = np_stable_sort_inplace
+
+def np_radix_sort(arr):
+    a = np.asarray(arr)
+    if a.size < 2:
+        return a.copy()
+    # Unsigned keys in value order: int64 gets its sign bit flipped, float64 bits get the sign bit
+    # flipped when positive and every bit flipped when negative
+    sign, floats = np.uint64(SIGN64), a.dtype.kind == "f"
+    if floats:
+        bits = a.view(np.uint64)
+        keys = bits ^ np.where(bits & sign, np.uint64(MASK64), sign)
+    else:
+        keys = a.view(np.uint64) ^ sign
+    for shift in range(0, 64, 8):
+        digit = ((keys >> np.uint64(shift)) & np.uint64(0xFF)).astype(np.uint8)
+        if np.bincount(digit, minlength=256).max() == keys.size:
+            continue  # every key shares this byte, the pass would not move anything
+        keys = keys[np.argsort(digit, kind="stable")]
+    if floats:
+        return (keys ^ np.where(keys & sign, sign, np.uint64(MASK64))).view(np.float64)
+    return (keys ^ sign).view(np.int64)
+
+def np_merge(left, right, out):
+    # Right-hand values land after equal left-hand values, which keeps the merge stable
+    pos = np.searchsorted(left, right, side="right") + np.arange(right.size)
+    rest = np.ones(out.size, dtype=bool)
+    rest[pos] = False
+    out[pos] = right
+    out[rest] = left
+
+def np_merge_sort(arr):
+    return np_merge_sort_inplace(np.array(arr))
+
+def np_merge_sort_inplace(a):
+    n, width = a.size, NP_MERGE_BLOCK
+    full = n - n % width
+    a[:full].reshape(-1, width).sort(axis=1, kind="stable")
+    a[full:].sort(kind="stable")
+    buf = np.empty_like(a)
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid, hi = min(lo + width, n), min(lo + 2 * width, n)
+            np_merge(a[lo:mid], a[mid:hi], buf[lo:hi])
+        a, buf, width = buf, a, width * 2
+    return a
+np_merge_sort.inplace = np_merge_sort_inplace
+
+for _f in (np_quick_sort, np_stable_sort, np_radix_sort, np_merge_sort):
+    _f.prepare = to_array  # timing harness converts to int64/float64 outside the timed window
 
 SORT_FUNCTIONS = {
     "Bubble Sort": bubble_sort,
@@ -97,36 +409,1672 @@ SORT_FUNCTIONS = {
     "Selection Sort": selection_sort,
     "Merge Sort": merge_sort,
     "Quick Sort": quick_sort,
-    "Radix Sort": radix_sort
+    "Radix Sort": radix_sort,
+    "Hybrid Sort": hybrid_sort
 }
 
+if np is not None:
+    SORT_FUNCTIONS.update({
+        "NumPy Radix Sort": np_radix_sort,
+        "NumPy Merge Sort": np_merge_sort,
+        "NumPy Sort (quick)": np_quick_sort,
+        "NumPy Sort (stable)": np_stable_sort,
+    })
+
 SORT_INFO = {
     "Bubble Sort": {
+        "Stable": True,
         "Advantages": "Simple to implement, good for small datasets.",
         "Disadvantages": "Very slow for large lists due to O(n²) time complexity."
     },
     "Insertion Sort": {
+        "Stable": True,
         "Advantages": "Simple, adaptive, efficient for nearly sorted data.",
         "Disadvantages": "O(n²) worst case, inefficient for large arrays."
     },
     "Selection Sort": {
+        "Stable": False,
         "Advantages": "Simple, performs well on small lists, few swaps.",
         "Disadvantages": "O(n²) time complexity regardless of input."
     },
     "Merge Sort": {
+        "Stable": True,
         "Advantages": "Stable, O(n log n) time, works well on large datasets.",
         "Disadvantages": "Requires extra memory, not in-place."
     },
     "Quick Sort": {
+        "Stable": False,
         "Advantages": "Very fast average case O(n log n), in-place sorting.",
         "Disadvantages": "Worst case O(n²), unstable sort."
     },
     "Radix Sort": {
-        "Advantages": "Efficient for integers, O(nk) time complexity.",
-        "Disadvantages": "Only works on integers or fixed-length keys."
+        "Stable": True,
+        "Advantages": "Efficient for integers, O(nk) time complexity; negatives are offset and floats sorted by their bit patterns.",
+        "Disadvantages": "k grows with the key width: float keys always take 20 decimal digit passes."
+    },
+    "Hybrid Sort": {
+        "Stable": False,
+        "Advantages": "Adaptive: merges natural runs, otherwise introsort with ninther pivots and 3-way partitioning; O(n log n) worst case.",
+        "Disadvantages": "More code paths, unstable when it falls back to introsort."
+    },
+    "NumPy Radix Sort": {
+        "Stable": True,
+        "Advantages": "Byte-wise LSD radix on int64/float64 arrays, O(8n), skips passes where all keys share a byte.",
+        "Disadvantages": "Needs NumPy, keeps a full copy of the keys per pass."
+    },
+    "NumPy Merge Sort": {
+        "Stable": True,
+        "Advantages": "Stable, bottom-up merges done as bulk array operations.",
+        "Disadvantages": "Needs NumPy, one extra buffer the size of the input."
+    },
+    "NumPy Sort (quick)": {
+        "Stable": False,
+        "Advantages": "Compiled introsort, the baseline for in-memory int64 sorting.",
+        "Disadvantages": "Needs NumPy, unstable sort."
+    },
+    "NumPy Sort (stable)": {
+        "Stable": True,
+        "Advantages": "Compiled radix/Timsort, stable and fast on presorted runs.",
+        "Disadvantages": "Needs NumPy, extra memory for the merge buffer."
+    }
+}
+
+# ----------------- Number File I/O ----------------- #
+READ_BLOCK = 1 << 20
+WRITE_BATCH = 1 << 16
+
+def _parse_tokens(tokens, as_array):
+    # int64 unless some token needs float64, in which case the whole block is float
+    if as_array:
+        if not tokens:
+            return np.empty(0, dtype=np.int64)
+        raw = np.array(tokens)
+        try:
+            return raw.astype(np.int64)
+        except ValueError:
+            return raw.astype(np.float64)
+        except OverflowError:
+            raise ValueError("a value does not fit int64")
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        return list(map(float, tokens))
+
+def join_blocks(blocks):
+    values = [x for block in blocks for x in block]
+    # Blocks parse independently, so an int block may come before a float one; promote them all then
+    if any(len(block) and type(block[0]) is float for block in blocks):
+        return [float(x) for x in values]
+    return values
+
+def number_code(values):
+    # array typecode for a set of numbers: "d" as soon as any value is a float, else "q"
+    if np is not None and isinstance(values, np.ndarray):
+        return "d" if values.dtype.kind == "f" else "q"
+    return "d" if any(type(x) is float for x in values) else "q"
+
+def number_dtype(values):
+    return "float64" if number_code(values) == "d" else "int64"
+
+def iter_number_blocks(path, block_size=READ_BLOCK, progress=None, as_array=False):
+    total, done, tail = os.path.getsize(path), 0, b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            done += len(block)
+            tokens = (tail + block).split()
+            # A token touching the end of the block may continue in the next one
+            tail = tokens.pop() if tokens and not block[-1:].isspace() else b""
+            yield _parse_tokens(tokens, as_array)
+            if progress:
+                progress(done / max(total, 1))
+    if tail:
+        yield _parse_tokens([tail], as_array)
+
+def read_number_chunks(path, max_count, block_size=READ_BLOCK, progress=None):
+    if is_binary(path):
+        values, header = load_binary(path)
+        for i in range(0, header["count"], max_count):
+            yield as_list(values[i:i + max_count])
+            if progress:
+                progress(min(1.0, (i + max_count) / header["count"]))
+        return
+    chunk = []
+    for block in iter_number_blocks(path, block_size, progress):
+        chunk.extend(block)
+        while len(chunk) >= max_count:
+            yield chunk[:max_count]
+            chunk = chunk[max_count:]
+    if chunk:
+        yield chunk
+
+# Binary dataset: 16-byte header (magic, version, dtype code, flags, count) then raw little-endian values
+BINARY_EXT = ".nsb"
+BINARY_MAGIC, BINARY_VERSION = b"NSRT", 1
+BINARY_HEADER = struct.Struct("<4sBcBxQ")
+BINARY_DTYPES = {"int64": b"q", "uint32": b"I", "float64": b"d"}
+NP_CODES = {"q": "<i8", "I": "<u4", "d": "<f8"}
+FLAG_SORTED = 1
+NUMBER_FILETYPES = [("Number Files", "*.txt *" + BINARY_EXT), ("Text Files", "*.txt"), ("Binary Numbers", "*" + BINARY_EXT)]
+
+def is_binary(path):
+    return path.lower().endswith(BINARY_EXT)
+
+def _batch_sorted(batch):
+    if np is not None:
+        return bool(np.all(np.diff(batch) >= 0))
+    return all(a <= b for a, b in zip(batch, islice(batch, 1, None)))
+
+def write_binary(path, values, dtype="int64", batch=WRITE_BATCH, progress=None, total=None):
+    code = BINARY_DTYPES[dtype].decode()
+    total = len(values) if total is None and hasattr(values, "__len__") else total
+    count, is_sorted, last = 0, True, None
+    with open(path, "wb") as f:
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, code.encode(), 0, 0))
+        for chunk in iter_batches(values, batch):
+            try:
+                buf = array(code, chunk)
+            except (OverflowError, TypeError):
+                raise ValueError(f"values do not fit {dtype}")
+            if is_sorted and chunk:
+                is_sorted = (last is None or last <= chunk[0]) and _batch_sorted(chunk)
+                last = chunk[-1]
+            if sys.byteorder == "big":
+                buf.byteswap()
+            buf.tofile(f)
+            count += len(chunk)
+            if progress and total:
+                progress(count / total)
+        # The header is rewritten once the count and sortedness are known
+        f.seek(0)
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, code.encode(), FLAG_SORTED if is_sorted else 0, count))
+    return count
+
+def read_binary_header(f):
+    magic, version, code, flags, count = BINARY_HEADER.unpack(f.read(BINARY_HEADER.size))
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError("not a binary number file")
+    dtype = {v: k for k, v in BINARY_DTYPES.items()}.get(code)
+    if dtype is None:
+        raise ValueError(f"unsupported dtype code {code!r}")
+    return {"dtype": dtype, "count": count, "sorted": bool(flags & FLAG_SORTED)}
+
+def load_binary(path):
+    with open(path, "rb") as f:
+        header = read_binary_header(f)
+        # Copy-on-write mapping: zero-copy reads, writes stay private to this process
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    code, count = BINARY_DTYPES[header["dtype"]].decode(), header["count"]
+    if np is not None:
+        values = np.frombuffer(mm, dtype=NP_CODES[code], count=count, offset=BINARY_HEADER.size)
+    elif sys.byteorder == "little":
+        values = memoryview(mm)[BINARY_HEADER.size:BINARY_HEADER.size + count * struct.calcsize(code)].cast(code)
+    else:
+        values = array(code, mm[BINARY_HEADER.size:])
+        values.byteswap()
+    return values, header
+
+def load_numbers(path, progress=None, as_array=False):
+    if is_binary(path):
+        values, _ = load_binary(path)
+        if progress:
+            progress(1.0)
+        return values
+    return read_numbers(path, progress, as_array)
+
+def save_numbers(path, values, progress=None):
+    if is_binary(path):
+        return write_binary(path, values, number_dtype(values), progress=progress)
+    return write_numbers(path, values, progress=progress)
+
+def convert_file(in_path, out_path, dtype="int64", progress=None):
+    if is_binary(in_path):
+        values, header = load_binary(in_path)
+        return save_numbers(out_path, values, progress) if not is_binary(out_path) else write_binary(out_path, values, dtype, progress=progress)
+    blocks = (x for block in iter_number_blocks(in_path, progress=progress) for x in block)
+    if is_binary(out_path):
+        return write_binary(out_path, blocks, dtype)
+    return write_numbers(out_path, blocks)
+
+def read_numbers(path, progress=None, as_array=False):
+    blocks = list(iter_number_blocks(path, progress=progress, as_array=as_array))
+    if as_array:
+        return np.concatenate(blocks) if blocks else np.empty(0, dtype=np.int64)
+    return join_blocks(blocks)
+
+def iter_batches(values, batch=WRITE_BATCH):
+    if hasattr(values, "__len__") and hasattr(values, "__getitem__"):
+        for i in range(0, len(values), batch):
+            yield as_list(values[i:i + batch])
+    else:
+        it = iter(values)
+        while chunk := list(islice(it, batch)):
+            yield chunk
+
+def write_numbers(path, values, batch=WRITE_BATCH, progress=None, total=None):
+    total = len(values) if total is None and hasattr(values, "__len__") else total
+    written = 0
+    with open(path, "w") as f:
+        for chunk in iter_batches(values, batch):
+            f.write((" " if written else "") + " ".join(map(str, chunk)))
+            written += len(chunk)
+            if progress and total:
+                progress(written / total)
+    return written
+
+# ----------------- Record Sorting ----------------- #
+RECORD_EXTS = (".csv", ".tsv")
+RECORD_FILETYPES = [("Records", "*.csv *.tsv")]
+
+def is_records(path):
+    return path.lower().endswith(RECORD_EXTS)
+
+def parse_number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+def promote_floats(values):
+    return [float(x) for x in values] if any(type(x) is float for x in values) else values
+
+def load_records(path, key="0"):
+    # key is a column name or index; the first row is a header when it names the key or its key cell is not a number
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f, delimiter="\t" if path.lower().endswith(".tsv") else ","))
+    header = rows[0] if rows and key in rows[0] else None
+    try:
+        column = header.index(key) if header else int(key)
+    except ValueError:
+        raise ValueError(f"{path}: no column {key!r}")
+    if header is None and rows:
+        try:
+            parse_number(rows[0][column])
+        except (ValueError, IndexError):
+            header = rows[0]
+    body = rows[1:] if header else rows
+    try:
+        keys = promote_floats([parse_number(row[column]) for row in body])
+    except (ValueError, IndexError):
+        raise ValueError(f"{path}: column {key!r} must hold a number in every row")
+    return header, body, keys
+
+def write_records(path, header, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f, delimiter="\t" if path.lower().endswith(".tsv") else ",")
+        if header:
+            writer.writerow(header)
+        writer.writerows(rows)
+
+def decorate(keys):
+    # Decorate-sort-undecorate: each key's dense rank is packed above its row index into one non-negative
+    # int, so every algorithm sorts plain ints, rows never move, and equal keys keep file order. Rank and
+    # index each take log2(n) bits, so the packed keys fit int64 (and the NumPy engines) below 2**31 rows.
+    if len(keys) == 0:
+        return [], 0
+    shift = (len(keys) - 1).bit_length()
+    if np is not None:
+        _, ranks = np.unique(np.asarray(keys), return_inverse=True)
+        return (ranks.astype(np.int64).reshape(-1) << shift | np.arange(len(keys), dtype=np.int64)).tolist(), shift
+    rank = {k: r for r, k in enumerate(sorted(set(keys)))}
+    return [rank[k] << shift | i for i, k in enumerate(keys)], shift
+
+def undecorate(packed, shift):
+    mask = (1 << shift) - 1
+    return [int(p) & mask for p in as_list(packed)]
+
+def sort_records(func, rows, keys):
+    packed, shift = decorate(keys)
+    order = undecorate(func(getattr(func, "prepare", as_list)(packed)), shift)
+    return [rows[i] for i in order]
+
+def stability_label(alg):
+    # On records the row index breaks ties, so even unstable algorithms keep equal keys in file order there
+    return "stable" if SORT_INFO[alg]["Stable"] else "unstable; the index tie-break keeps records stable"
+
+# ----------------- Benchmark Engine ----------------- #
+DEFAULT_REPEAT, DEFAULT_WARMUP = 5, 1
+
+def summarize(samples_ns):
+    s = sorted(samples_ns)
+    secs = [x / 1e9 for x in s]
+    return {
+        "min": secs[0],
+        "median": statistics.median(secs),
+        "p95": secs[max(0, math.ceil(0.95 * len(secs)) - 1)],
+        "stddev": statistics.stdev(secs) if len(secs) > 1 else 0.0,
+        "mean": statistics.fmean(secs),
+        "runs": len(secs),
+        "samples": [x / 1e9 for x in samples_ns],
     }
+
+# ----------------- Verification ----------------- #
+INVERSION_SAMPLE = 4096
+
+def _mix64(x):
+    # splitmix64 finalizer: spreads every input bit over the 64-bit hash
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EB & MASK64
+    return x ^ (x >> 31)
+
+def _word(x):
+    # 64-bit word hashed for one value: IEEE-754 bits for floats, two's complement for ints, wider ints folded.
+    # Adding 0.0 turns -0.0 into 0.0: they compare equal and compiled sorts do not keep them apart.
+    if type(x) is float:
+        return struct.unpack("<Q", struct.pack("<d", x + 0.0))[0]
+    return x & MASK64 if -SIGN64 <= x <= MASK64 else (x & MASK64) ^ _mix64(x >> 64 & MASK64)
+
+def multiset_hash(values):
+    # Order-independent: the sum of mixed element hashes, equal for any permutation of the same values
+    if np is not None:
+        try:
+            total = 0
+            for i in range(0, len(values), READ_BLOCK):
+                x = np.asarray(values[i:i + READ_BLOCK])
+                x = (x + 0.0).view(np.uint64) if x.dtype.kind == "f" else x.astype(np.int64).view(np.uint64)
+                with np.errstate(over="ignore"):
+                    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+                    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+                    total += int((x ^ (x >> np.uint64(31))).sum(dtype=np.uint64))
+            return len(values), total & MASK64
+        except OverflowError:
+            pass  # ints wider than int64 (packed record keys) take the pure Python path
+    return len(values), sum(_mix64(_word(x)) for x in values) & MASK64
+
+def is_non_decreasing(values):
+    if np is not None and isinstance(values, np.ndarray):
+        return bool(np.all(values[1:] >= values[:-1]))
+    return all(map(operator.le, values, islice(values, 1, None)))
+
+def verify_sort(output, input_hash):
+    ordered = is_non_decreasing(output)
+    permutation = multiset_hash(output) == input_hash
+    return {"verified": ordered and permutation, "ordered": ordered, "permutation": permutation}
+
+def first_difference(a, b):
+    # Index of the first mismatch between two outputs, len of the shorter one on a length mismatch, None if equal
+    n = min(len(a), len(b))
+    if np is not None:
+        diff = np.flatnonzero(np.asarray(a[:n]) != np.asarray(b[:n]))
+        i = int(diff[0]) if len(diff) else n
+    else:
+        i = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), n)
+    return None if i == n and len(a) == len(b) else i
+
+def count_inversions(seq):
+    # Bottom-up merge sort that counts, for each element taken from the right run, the left elements it jumps
+    src, n, width, inversions = list(seq), len(seq), 1, 0
+    dst = src.copy()
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid, hi = min(lo + width, n), min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if src[j] < src[i]:
+                    dst[k] = src[j]; j += 1; inversions += mid - i
+                else:
+                    dst[k] = src[i]; i += 1
+                k += 1
+            dst[k:hi] = src[i:mid] if i < mid else src[j:hi]
+        src, dst, width = dst, src, width * 2
+    return inversions
+
+def presortedness(values, sample=INVERSION_SAMPLE, seed=0):
+    n = len(values)
+    if n < 2:
+        return {"runs": n, "longest_run": n, "inversions": 0, "inversion_ratio": 0.0}
+    if np is not None:
+        a = np.asarray(values)
+        breaks = np.flatnonzero(a[1:] < a[:-1]) + 1
+        edges = np.concatenate(([0], breaks, [n]))
+        runs, longest = len(breaks) + 1, int(np.diff(edges).max())
+    else:
+        runs, longest, current = 1, 1, 1
+        for x, y in zip(values, islice(values, 1, None)):
+            if y < x:
+                runs += 1; current = 1
+            else:
+                current += 1
+                longest = max(longest, current)
+    # Inversions are estimated from an order-preserving random sample, keeping the whole pass linear
+    if n <= sample:
+        inversions = count_inversions(as_list(values))
+    else:
+        idx = sorted(random.Random(seed).sample(range(n), sample))
+        sub = as_list(values[idx]) if np is not None and isinstance(values, np.ndarray) else [values[i] for i in idx]
+        inversions = round(count_inversions(sub) * (n * (n - 1)) / (sample * (sample - 1)))
+    return {"runs": runs, "longest_run": longest, "inversions": inversions, "inversion_ratio": inversions / (n * (n - 1) / 2)}
+
+def format_presortedness(p):
+    return f"{p['runs']} runs, longest run {p['longest_run']}, ~{p['inversions']} inversions ({p['inversion_ratio']:.1%} of max)"
+
+# ----------------- Profiling ----------------- #
+# Opt-in operation counting: the input is wrapped in counting types for one extra untimed
+# run, so the algorithms themselves carry no instrumentation and normal runs pay nothing.
+_OP_COUNTS = {"comparisons": 0, "writes": 0}
+
+class CountingCompare:
+    __slots__ = ()
+
+    def __lt__(self, other):
+        _OP_COUNTS["comparisons"] += 1
+        return super().__lt__(other)
+
+    def __gt__(self, other):
+        _OP_COUNTS["comparisons"] += 1
+        return super().__gt__(other)
+
+    def __le__(self, other):
+        _OP_COUNTS["comparisons"] += 1
+        return super().__le__(other)
+
+    def __ge__(self, other):
+        _OP_COUNTS["comparisons"] += 1
+        return super().__ge__(other)
+
+class CountingInt(CountingCompare, int):
+    __slots__ = ()
+
+class CountingFloat(CountingCompare, float):
+    __slots__ = ()
+
+class CountingList(list):
+    def __setitem__(self, index, value):
+        _OP_COUNTS["writes"] += len(value) if isinstance(index, slice) else 1
+        list.__setitem__(self, index, value)
+
+    def copy(self):
+        return CountingList(self)
+
+def count_operations(func, numbers):
+    if hasattr(func, "prepare"):
+        return {}  # vectorized engines sort raw int64 buffers, nothing to intercept
+    data = CountingList(CountingFloat(x) if isinstance(x, float) else CountingInt(x) for x in as_list(numbers))
+    _OP_COUNTS.update(comparisons=0, writes=0)
+    getattr(func, "inplace", func)(data)
+    return dict(_OP_COUNTS)
+
+def gc_collections():
+    return sum(gen["collections"] for gen in gc.get_stats())
+
+def profile_memory(func, numbers):
+    # Separate untimed run: tracemalloc slows allocation-heavy code too much to share with timing.
+    # CPython keeps no running allocation count; gen-0 GC runs trigger every few hundred net container
+    # allocations, so gc_collections is the allocation-pressure signal.
+    data = getattr(func, "prepare", as_list)(numbers)
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, collections = tracemalloc.get_traced_memory()[0], gc_collections()
+    try:
+        getattr(func, "inplace", func)(data)
+        return {
+            "peak_bytes": tracemalloc.get_traced_memory()[1] - base,
+            "gc_collections": gc_collections() - collections,
+        }
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+# ----------------- Timing Harness ----------------- #
+def time_sort(func, numbers, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP, memory=False, count_ops=False,
+              verify=True, input_hash=None, progress=None):
+    # prepare always returns a fresh copy, so the sort's in-place entry point may consume it
+    prepare, run, runs = getattr(func, "prepare", as_list), getattr(func, "inplace", func), warmup + max(1, repeat)
+    def stage(k):
+        # Maps the running sort's own fraction onto the whole warmup + repeat schedule
+        return None if progress is None else (lambda frac: progress((k + frac) / runs))
+    samples, gc_was_enabled, result = [], gc.isenabled(), None
+    try:
+        for k in range(warmup):
+            set_progress_hook(stage(k))
+            run(prepare(numbers))
+        for k in range(warmup, runs):
+            # Input copy and GC sweep happen outside the timed window
+            data, result = prepare(numbers), None
+            set_progress_hook(stage(k))
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter_ns()
+                result = run(data)
+                end = time.perf_counter_ns()
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            samples.append(end - start)
+    finally:
+        set_progress_hook(None)
+    stats = summarize(samples)
+    if verify:
+        stats.update(verify_sort(result, input_hash or multiset_hash(numbers)))
+    if memory:
+        stats.update(profile_memory(func, numbers))
+    if count_ops:
+        stats.update(count_operations(func, numbers))
+    return stats, result
+
+def format_stats(stats):
+    if "error" in stats:
+        return f"failed ({stats['error']})"
+    text = (f"min {stats['min']:.4f}s | median {stats['median']:.4f}s | "
+            f"p95 {stats['p95']:.4f}s | stddev {stats['stddev']:.4f}s ({stats['runs']} runs)")
+    if "verified" in stats:
+        text += " | ✅ verified" if stats["verified"] else f" | ❌ {'not sorted' if not stats['ordered'] else 'not a permutation of the input'}"
+    if "peak_bytes" in stats:
+        text += f" | peak {stats['peak_bytes'] / 2**20:.2f} MB, {stats['gc_collections']} GCs"
+    if "comparisons" in stats:
+        text += f" | {stats['comparisons']} cmp, {stats['writes']} writes"
+    return text
+
+# column key -> (header, width, formatter)
+PROFILE_COLUMNS = {
+    "peak_bytes": ("peak (MB)", 11, lambda v: f"{v / 2**20:.2f}"),
+    "gc_collections": ("GCs", 6, str),
+    "comparisons": ("comparisons", 14, str),
+    "writes": ("writes", 14, str),
 }
 
+def results_table(results):
+    w = max([20] + [len(alg) + 1 for alg in results])  # labels are never cut, so distinct rows stay distinct
+    lines = [f"{'Algorithm':<{w}}{'min (s)':>11}{'median (s)':>12}{'p95 (s)':>11}{'stddev (s)':>12}"]
+    for alg, st in results.items():
+        lines.append(f"{alg:<{w}}{st['min']:>11.4f}{st['median']:>12.4f}{st['p95']:>11.4f}{st['stddev']:>12.4f}")
+    columns = [k for k in PROFILE_COLUMNS if any(k in st for st in results.values())]
+    if columns:
+        lines += ["", f"{'Algorithm':<{w}}" + "".join(f"{PROFILE_COLUMNS[k][0]:>{PROFILE_COLUMNS[k][1]}}" for k in columns)]
+        for alg, st in results.items():
+            cells = (PROFILE_COLUMNS[k][2](st[k]) if k in st else "-" for k in columns)
+            lines.append(f"{alg:<{w}}" + "".join(f"{c:>{PROFILE_COLUMNS[k][1]}}" for k, c in zip(columns, cells)))
+    return "\n".join(lines) + "\n"
+
+def resolve_algorithms(names):
+    if not names:
+        return list(SORT_FUNCTIONS)
+    lookup = {}
+    for alg in SORT_FUNCTIONS:
+        lookup[alg.lower()] = alg
+        lookup[alg.lower().replace(" sort", "")] = alg
+    try:
+        return [lookup[n.lower().strip()] for n in names]
+    except KeyError as e:
+        raise ValueError(f"Unknown algorithm {e.args[0]!r}, choose from: {', '.join(SORT_FUNCTIONS)}")
+
+def input_order(numbers):
+    return {f"input_{k}": v for k, v in presortedness(numbers).items()}
+
+def benchmark(datasets, algorithms, progress=None, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP, memory=False, count_ops=False):
+    records, total = [], len(datasets) * len(algorithms)
+    for name, numbers in datasets:
+        fingerprint, input_hash, order = dataset_fingerprint(numbers), multiset_hash(numbers), input_order(numbers)
+        for alg in algorithms:
+            try:
+                stats, _ = time_sort(SORT_FUNCTIONS[alg], numbers, repeat, warmup, memory, count_ops, input_hash=input_hash)
+            except Exception as e:  # e.g. RecursionError from Quick Sort on presorted input
+                stats = {"error": f"{type(e).__name__}: {e}"}
+            records.append({"dataset": name, "size": len(numbers), "algorithm": alg, "stable": SORT_INFO[alg]["Stable"],
+                            "fingerprint": fingerprint, **order, **stats})
+            if progress:
+                progress(len(records) / total, records[-1])
+    return records
+
+# ----------------- Parallel Execution ----------------- #
+def share_numbers(numbers):
+    # Returns (shm, source) where jobs rebuild the input from source via attach_numbers. Ints wider
+    # than int64 (packed record keys) cannot live in shared memory and travel pickled instead (shm None).
+    code = number_code(numbers)
+    try:
+        if np is not None and isinstance(numbers, np.ndarray):
+            buf = np.ascontiguousarray(numbers, dtype=np.float64 if code == "d" else np.int64)
+        else:
+            buf = array(code, numbers)
+    except OverflowError:
+        return None, list(numbers)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(buf) * buf.itemsize))
+    shm.buf[:len(buf) * buf.itemsize] = memoryview(buf).cast("B")
+    return shm, (shm.name, len(buf), code)
+
+def attach_numbers(source):
+    if isinstance(source, list):
+        return source
+    name, count, code = source
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf[:count * 8]
+        numbers = view.cast(code).tolist()
+        view.release()
+        return numbers
+    finally:
+        shm.close()
+
+def release_numbers(shm):
+    if shm is not None:
+        shm.close()
+        shm.unlink()
+
+def _bench_job(source, alg, repeat, warmup, memory=False, count_ops=False):
+    return time_sort(SORT_FUNCTIONS[alg], attach_numbers(source), repeat, warmup, memory, count_ops)[0]
+
+def default_workers():
+    return os.cpu_count() or 1
+
+def parallel_benchmark(datasets, algorithms, progress=None, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP,
+                       workers=None, memory=False, count_ops=False):
+    # Each dataset is copied into shared memory once; jobs only ship its name and length
+    shared = [share_numbers(numbers) for _, numbers in datasets]
+    records, total = [], len(datasets) * len(algorithms)
+    try:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(workers or default_workers(), total), mp_context=ctx) as pool:
+            jobs = {}
+            for d, ((name, numbers), (_, source)) in enumerate(zip(datasets, shared)):
+                fingerprint, order = dataset_fingerprint(numbers), input_order(numbers)
+                for a, alg in enumerate(algorithms):
+                    fut = pool.submit(_bench_job, source, alg, repeat, warmup, memory, count_ops)
+                    jobs[fut] = (d, a, name, len(numbers), alg, fingerprint, order)
+            for fut in as_completed(jobs):
+                d, a, name, size, alg, fingerprint, order = jobs[fut]
+                try:
+                    stats = fut.result()
+                except Exception as e:
+                    stats = {"error": f"{type(e).__name__}: {e}"}
+                records.append({"dataset": name, "size": size, "algorithm": alg, "stable": SORT_INFO[alg]["Stable"],
+                                "fingerprint": fingerprint, **order, **stats, "_order": (d, a)})
+                if progress:
+                    progress(len(records) / total, records[-1])
+    finally:
+        for shm, _ in shared:
+            release_numbers(shm)
+    records.sort(key=lambda r: r.pop("_order"))
+    return records
+
+# ----------------- Parallel Sorts ----------------- #
+PARALLEL_WORKERS_ENV = "SORTER_WORKERS"
+PARALLEL_MIN = 1024      # below this the single-core kernel is faster than any hand-off
+SAMPLE_OVERSAMPLE = 32   # splitter candidates drawn per bucket in sample sort
+_pool, _pool_size = None, 0
+
+def parallel_workers():
+    return int(os.environ.get(PARALLEL_WORKERS_ENV, 0)) or default_workers()
+
+def set_parallel_workers(n):
+    # Kept in the environment so spawned benchmark and scheduler processes inherit it
+    os.environ[PARALLEL_WORKERS_ENV] = str(max(1, int(n)))
+
+def parallel_pool():
+    # One pool per process, started on first use and reused, so warmup runs absorb its start-up cost
+    global _pool, _pool_size
+    if _pool is None or _pool_size != parallel_workers():
+        shutdown_parallel_pool()
+        _pool_size = parallel_workers()
+        _pool = multiprocessing.get_context("spawn").Pool(_pool_size)
+    return _pool
+
+def shutdown_parallel_pool():
+    global _pool
+    if _pool is not None:
+        _pool.terminate()
+        _pool = None
+
+def _shared_empty(count, code):
+    shm = shared_memory.SharedMemory(create=True, size=max(1, count * struct.calcsize(code)))
+    return shm, (shm.name, count, code)
+
+def _typed_view(shm, source):
+    _, count, code = source
+    data = shm.buf[:count * struct.calcsize(code)]
+    return np.frombuffer(data, dtype=NP_CODES[code]) if np is not None else data.cast(code)
+
+def _shared_call(source, work, *args):
+    # Runs work(view, *args) on a shared dataset in place. Views die with work's frame, so the mapping
+    # can close afterwards; only an exception's traceback may still pin them.
+    shm = shared_memory.SharedMemory(name=source[0])
+    try:
+        return work(_typed_view(shm, source), *args)
+    finally:
+        with contextlib.suppress(BufferError):
+            shm.close()
+
+def _store_slice(view, lo, values):
+    view[lo:lo + len(values)] = values
+
+def _copy_out(view, as_array):
+    return np.array(view) if as_array else view.tolist()
+
+def _pick(view, idx):
+    return view[idx].tolist() if np is not None else [view[i] for i in idx]
+
+def _pms_sort_run(a, lo, hi, parts):
+    run = a[lo:hi]
+    if np is not None:
+        run.sort(kind="stable")
+    else:
+        run[:] = array(a.format, merge_sort(run.tolist()))
+    # Regular samples of every sorted run choose the merge splitters
+    return _pick(run, [(hi - lo) * k // parts for k in range(1, parts)])
+
+def _cut_runs(a, runs, splitters):
+    # Splitting each run left of every splitter keeps equal keys in run order, so the merge stays stable
+    if np is not None:
+        return [[lo, *(np.searchsorted(a[lo:hi], splitters, side="left") + lo).tolist(), hi] for lo, hi in runs]
+    return [[lo, *(bisect.bisect_left(a, x, lo, hi) for x in splitters), hi] for lo, hi in runs]
+
+def _pms_merge(a, pieces, out, out_lo):
+    if np is not None:
+        merged = np.concatenate([a[lo:hi] for lo, hi in pieces])
+        merged.sort(kind="stable")  # Timsort, so this is a k-way merge of the presorted pieces
+    else:
+        merged = array(a.format, heapq.merge(*(a[lo:hi].tolist() for lo, hi in pieces)))
+    _shared_call(out, _store_slice, out_lo, merged)
+
+def _pss_partition(a, lo, hi, splitters):
+    # Groups the chunk by destination bucket in place and returns the bucket sizes
+    chunk = a[lo:hi]
+    if np is not None:
+        bucket = np.searchsorted(np.asarray(splitters), chunk, side="right")
+        chunk[:] = chunk[np.argsort(bucket, kind="stable")]
+        return np.bincount(bucket, minlength=len(splitters) + 1).tolist()
+    buckets = [[] for _ in range(len(splitters) + 1)]
+    for x in chunk.tolist():
+        buckets[bisect.bisect_right(splitters, x)].append(x)
+    chunk[:] = array(a.format, [x for b in buckets for x in b])
+    return [len(b) for b in buckets]
+
+def _pss_bucket(a, pieces, out, out_lo):
+    if np is not None:
+        bucket = np.concatenate([a[lo:hi] for lo, hi in pieces])
+        bucket.sort()
+    else:
+        bucket = array(a.format, hybrid_sort([x for lo, hi in pieces for x in a[lo:hi].tolist()]))
+    _shared_call(out, _store_slice, out_lo, bucket)
+
+def _parallel_setup(arr):
+    src, source = share_numbers(arr)
+    if src is None:
+        raise ValueError("parallel sorts need int64 or float64 values")
+    n, parts = len(arr), parallel_workers()
+    bounds = [n * i // parts for i in range(parts + 1)]
+    return src, source, parts, list(zip(bounds, bounds[1:]))
+
+def parallel_merge_sort(arr):
+    if len(arr) < PARALLEL_MIN or parallel_workers() < 2:
+        return np.sort(arr, kind="stable") if np is not None else merge_sort(arr)
+    as_array, pool = np is not None and isinstance(arr, np.ndarray), parallel_pool()
+    src, source, parts, runs = _parallel_setup(arr)
+    dst, out = _shared_empty(len(arr), source[2])
+    try:
+        # Each worker sorts one contiguous run in shared memory with the stable kernel
+        samples = pool.starmap(_shared_call, [(source, _pms_sort_run, lo, hi, parts) for lo, hi in runs])
+        report_progress(0.5)
+        samples = sorted(x for run in samples for x in run)
+        splitters = [samples[len(samples) * j // parts] for j in range(1, parts)]
+        cuts = _shared_call(source, _cut_runs, runs, splitters)
+        # Output segment j is the k-way merge of every run's j-th piece, written at its final offset
+        jobs, out_lo = [], 0
+        for j in range(parts):
+            pieces = [(c[j], c[j + 1]) for c in cuts]
+            jobs.append((source, _pms_merge, pieces, out, out_lo))
+            out_lo += sum(hi - lo for lo, hi in pieces)
+        pool.starmap(_shared_call, jobs)
+        return _shared_call(out, _copy_out, as_array)
+    finally:
+        release_numbers(src)
+        release_numbers(dst)
+
+def parallel_sample_sort(arr):
+    if len(arr) < PARALLEL_MIN or parallel_workers() < 2:
+        return np.sort(arr) if np is not None else hybrid_sort(arr)
+    as_array, pool = np is not None and isinstance(arr, np.ndarray), parallel_pool()
+    src, source, parts, runs = _parallel_setup(arr)
+    dst, out = _shared_empty(len(arr), source[2])
+    try:
+        # Splitters come from an oversampled random sample of the still unsorted input
+        rng = random.Random(len(arr))
+        sample = sorted(_shared_call(source, _pick, [rng.randrange(len(arr)) for _ in range(parts * SAMPLE_OVERSAMPLE)]))
+        splitters = [sample[len(sample) * j // parts] for j in range(1, parts)]
+        counts = pool.starmap(_shared_call, [(source, _pss_partition, lo, hi, splitters) for lo, hi in runs])
+        report_progress(0.5)
+        # Bucket exchange: worker b gathers bucket b from every chunk, sorts it and writes it at its offset
+        jobs, out_lo = [], 0
+        for b in range(parts):
+            pieces = []
+            for (lo, _), c in zip(runs, counts):
+                start = lo + sum(c[:b])
+                pieces.append((start, start + c[b]))
+            jobs.append((source, _pss_bucket, pieces, out, out_lo))
+            out_lo += sum(c[b] for c in counts)
+        pool.starmap(_shared_call, jobs)
+        return _shared_call(out, _copy_out, as_array)
+    finally:
+        release_numbers(src)
+        release_numbers(dst)
+
+for _f in (parallel_merge_sort, parallel_sample_sort):
+    _f.prepare = to_array if np is not None else as_list  # also keeps operation counting out of worker processes
+
+SORT_FUNCTIONS.update({
+    "Parallel Merge Sort": parallel_merge_sort,
+    "Parallel Sample Sort": parallel_sample_sort,
+})
+
+SORT_INFO.update({
+    "Parallel Merge Sort": {
+        "Stable": True,
+        "Advantages": "Sorts one run per core in shared memory, then merges splitter-bounded pieces on every core at once.",
+        "Disadvantages": "Copies the input into shared memory and back; the first call pays for starting the worker pool."
+    },
+    "Parallel Sample Sort": {
+        "Stable": False,
+        "Advantages": "One bucket exchange by sampled splitters, then every core sorts its own bucket independently.",
+        "Disadvantages": "Buckets unbalance on inputs with few distinct values; unstable."
+    },
+})
+
+# Single-core versions of the kernels each parallel sort runs on its partitions
+PARALLEL_BASELINES = {
+    "Parallel Merge Sort": "NumPy Sort (stable)" if np is not None else "Merge Sort",
+    "Parallel Sample Sort": "NumPy Sort (quick)" if np is not None else "Hybrid Sort",
+}
+
+def add_baselines(algorithms):
+    # Appends the single-core kernel of every selected parallel sort, so its speedup can be reported
+    added = []
+    for alg in list(algorithms):
+        base = PARALLEL_BASELINES.get(alg)
+        if base is not None and base not in algorithms:
+            algorithms.append(base)
+            added.append(base)
+    return added
+
+def speedup_report(results, workers=None):
+    workers, lines = workers or parallel_workers(), []
+    for alg, base in PARALLEL_BASELINES.items():
+        if "median" in results.get(alg, {}) and "median" in results.get(base, {}):
+            speedup = results[base]["median"] / results[alg]["median"]
+            lines.append(f"{alg}: {speedup:.2f}x over {base} on {workers} workers ({speedup / workers:.0%} efficiency)")
+    return "\n".join(lines)
+
+# ----------------- Job Scheduler ----------------- #
+JOB_TIMEOUT = 300.0  # default per-algorithm limit in seconds
+UI_FRAME_MS = 16     # the GUI drains its event queue once per frame (~60 fps)
+PROGRESS_INTERVAL = UI_FRAME_MS / 1000  # workers send at most one progress event per frame
+POLL_INTERVAL = 0.05
+STOP_GRACE = 2.0  # seconds a terminated job gets to clean up before it is killed
+
+def _stop_job(*_):
+    # Unwinds through the parallel sorts' cleanup, so a terminated job frees its shared memory and worker pool
+    raise SystemExit(1)
+
+def _sort_job(conn, source, alg, repeat, warmup, memory, count_ops):
+    signal.signal(signal.SIGTERM, _stop_job)
+    last = [0.0]
+    def progress(frac):
+        now = time.perf_counter()
+        if now - last[0] >= PROGRESS_INTERVAL:
+            last[0] = now
+            conn.send(("progress", frac))
+    try:
+        stats, result = time_sort(SORT_FUNCTIONS[alg], attach_numbers(source), repeat, warmup, memory, count_ops, progress=progress)
+        message = "done", (stats, result)
+    except Exception as e:
+        message = "error", f"{type(e).__name__}: {e}"
+    # The scheduler stops a job as soon as it reports, so the worker pool goes down first
+    shutdown_parallel_pool()
+    conn.send(message)
+    conn.close()
+
+def _external_job(conn, in_path, out_path, algorithm, memory_mb):
+    signal.signal(signal.SIGTERM, _stop_job)  # unwinding also removes the spilled runs
+    last = [0.0]
+    def progress(phase, frac):
+        now = time.perf_counter()
+        if now - last[0] >= PROGRESS_INTERVAL:
+            last[0] = now
+            conn.send(("progress", (phase, frac)))
+    try:
+        message = "done", external_sort(in_path, out_path, algorithm, memory_mb, progress)
+    except Exception as e:
+        message = "error", f"{type(e).__name__}: {e}"
+    shutdown_parallel_pool()
+    conn.send(message)
+    conn.close()
+
+def _sweep_job(conn, algorithms, sizes, budget, distribution, param):
+    signal.signal(signal.SIGTERM, _stop_job)
+    try:
+        progress = lambda frac, alg, point: conn.send(("progress", (frac, alg, point)))  # one event per point
+        message = "done", scaling_sweep(algorithms, sizes, budget, distribution, param, progress=progress)
+    except Exception as e:
+        message = "error", f"{type(e).__name__}: {e}"
+    shutdown_parallel_pool()
+    conn.send(message)
+    conn.close()
+
+class SortScheduler:
+    # Every algorithm runs in its own spawned process with a private pipe, so a job that is cancelled
+    # or exceeds its timeout is simply terminated without disturbing the others
+    def __init__(self, numbers, algorithms, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP, workers=1,
+                 timeout=JOB_TIMEOUT, memory=False, count_ops=False):
+        self.numbers, self.algorithms = numbers, list(algorithms)
+        self.options = (repeat, warmup, memory, count_ops)
+        self.workers, self.timeout = max(1, workers), timeout
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def _start(self, ctx, source, alg):
+        reader, writer = ctx.Pipe(duplex=False)
+        # Not daemonic: the parallel sorts start a worker pool inside the job
+        proc = ctx.Process(target=_sort_job, args=(writer, source, alg, *self.options))
+        proc.start()
+        writer.close()  # only the child holds the write end now, so a crashed worker reads as EOF
+        return reader, (alg, proc, time.monotonic() + self.timeout if self.timeout else None)
+
+    @staticmethod
+    def _stop(reader, proc):
+        if proc.is_alive():
+            proc.terminate()
+            proc.join(STOP_GRACE)
+            if proc.is_alive():
+                proc.kill()
+        proc.join()
+        reader.close()
+
+    def run(self):
+        # Yields (kind, algorithm, payload) with kind one of start, progress, done, error, timeout, cancelled
+        ctx, (shm, source) = multiprocessing.get_context("spawn"), share_numbers(self.numbers)
+        pending, running = list(self.algorithms), {}
+        try:
+            while pending or running:
+                while pending and len(running) < self.workers and not self.cancelled.is_set():
+                    alg = pending.pop(0)
+                    reader, job = self._start(ctx, source, alg)
+                    running[reader] = job
+                    yield "start", alg, None
+                if self.cancelled.is_set():
+                    for reader, (alg, proc, _) in list(running.items()):
+                        self._stop(reader, proc)
+                        del running[reader]
+                        yield "cancelled", alg, None
+                    for alg in pending:
+                        yield "cancelled", alg, None
+                    return
+                for reader in multiprocessing.connection.wait(list(running), timeout=POLL_INTERVAL):
+                    alg, proc, _ = running[reader]
+                    try:
+                        kind, payload = reader.recv()
+                    except EOFError:
+                        proc.join()
+                        kind, payload = "error", f"worker exited with code {proc.exitcode}"
+                    if kind != "progress":
+                        self._stop(reader, proc)
+                        del running[reader]
+                    yield kind, alg, payload
+                now = time.monotonic()
+                for reader, (alg, proc, deadline) in list(running.items()):
+                    if deadline is not None and now > deadline:
+                        self._stop(reader, proc)
+                        del running[reader]
+                        yield "timeout", alg, self.timeout
+        finally:
+            for reader, (_, proc, _) in running.items():
+                self._stop(reader, proc)
+            release_numbers(shm)
+
+def run_job(target, args, cancel, progress=None):
+    # Runs target(conn, *args) in a spawned process and returns its final (kind, payload);
+    # ("cancelled", None) once cancel is set, in which case the process is stopped
+    ctx = multiprocessing.get_context("spawn")
+    reader, writer = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=target, args=(writer, *args))
+    proc.start()
+    writer.close()
+    try:
+        while not cancel.is_set():
+            if not reader.poll(POLL_INTERVAL):
+                continue
+            try:
+                kind, payload = reader.recv()
+            except EOFError:
+                proc.join()
+                return "error", f"worker exited with code {proc.exitcode}"
+            if kind != "progress":
+                return kind, payload
+            if progress:
+                progress(payload)
+        return "cancelled", None
+    finally:
+        SortScheduler._stop(reader, proc)
+
+# ----------------- Input Distributions ----------------- #
+GEN_LOW, GEN_HIGH = 1, 10**9
+
+def _dist_uniform(n, rng, _):
+    if np is not None:
+        return rng.integers(GEN_LOW, GEN_HIGH, size=n, endpoint=True, dtype=np.int64)
+    return [rng.randint(GEN_LOW, GEN_HIGH) for _ in range(n)]
+
+def _dist_sorted(n, rng, _):
+    a = _dist_uniform(n, rng, _)
+    a.sort()
+    return a
+
+def _dist_reversed(n, rng, _):
+    return _dist_sorted(n, rng, _)[::-1]
+
+def _dist_k_sorted(n, rng, k):
+    # Jittering each rank by less than k moves every element fewer than k places from home
+    a = _dist_sorted(n, rng, None)
+    if np is not None:
+        return a[np.argsort(np.arange(n) + rng.uniform(0, k, n), kind="stable")]
+    order = sorted(range(n), key=lambda i: i + rng.uniform(0, k))
+    return [a[i] for i in order]
+
+def _dist_few_unique(n, rng, unique):
+    values = _dist_uniform(max(1, int(unique)), rng, None)
+    if np is not None:
+        return values[rng.integers(0, len(values), size=n)]
+    return [rng.choice(values) for _ in range(n)]
+
+def _dist_sawtooth(n, rng, teeth):
+    period = max(1, n // max(1, int(teeth)))
+    scale = max(1, GEN_HIGH // period)
+    if np is not None:
+        return (np.arange(n, dtype=np.int64) % period) * scale + GEN_LOW
+    return [(i % period) * scale + GEN_LOW for i in range(n)]
+
+def _dist_organ_pipe(n, rng, _):
+    scale = max(1, GEN_HIGH // max(1, n // 2 + 1))
+    if np is not None:
+        i = np.arange(n, dtype=np.int64)
+        return np.minimum(i, n - 1 - i) * scale + GEN_LOW
+    return [min(i, n - 1 - i) * scale + GEN_LOW for i in range(n)]
+
+def _dist_gaussian(n, rng, sigma):
+    mid, spread = (GEN_LOW + GEN_HIGH) / 2, sigma * (GEN_HIGH - GEN_LOW)
+    if np is not None:
+        return np.clip(np.rint(rng.normal(mid, spread, n)), GEN_LOW, GEN_HIGH).astype(np.int64)
+    return [min(GEN_HIGH, max(GEN_LOW, round(rng.gauss(mid, spread)))) for _ in range(n)]
+
+def _dist_zipf(n, rng, a):
+    if np is not None:
+        return np.minimum(rng.zipf(a, n), GEN_HIGH).astype(np.int64)
+    # Discretised Pareto tail, the continuous counterpart of a Zipf law with exponent a
+    return [min(GEN_HIGH, int(rng.paretovariate(a - 1))) for _ in range(n)]
+
+# name -> (generator, parameter name, default value)
+DISTRIBUTIONS = {
+    "uniform": (_dist_uniform, None, None),
+    "sorted": (_dist_sorted, None, None),
+    "reversed": (_dist_reversed, None, None),
+    "k-sorted": (_dist_k_sorted, "k", 10),
+    "few-unique": (_dist_few_unique, "unique", 10),
+    "sawtooth": (_dist_sawtooth, "teeth", 10),
+    "organ-pipe": (_dist_organ_pipe, None, None),
+    "gaussian": (_dist_gaussian, "sigma", 0.1),
+    "zipf": (_dist_zipf, "a", 1.5),
+}
+
+def generate_values(count, seed=None, distribution="uniform", param=None):
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {distribution!r}, choose from: {', '.join(DISTRIBUTIONS)}")
+    func, name, default = DISTRIBUTIONS[distribution]
+    param = default if param is None else param
+    if distribution == "zipf" and param <= 1:
+        raise ValueError("zipf needs a > 1")
+    rng = np.random.default_rng(seed) if np is not None else random.Random(seed)
+    values = func(count, rng, param)
+    return np.ascontiguousarray(values) if np is not None else values
+
+def describe_distribution(distribution, param=None):
+    _, name, default = DISTRIBUTIONS[distribution]
+    return distribution if name is None else f"{distribution}({name}={default if param is None else param:g})"
+
+# ----------------- File Generator ----------------- #
+GEN_STEP = 15000  # each generated file holds this many more numbers than the previous one
+GEN_PREFIX = "numbers_file_"
+
+def file_seed(seed, index):
+    # Independent, reproducible per-file streams regardless of which worker writes the file
+    return int.from_bytes(hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=8).digest(), "little")
+
+def generate_file(path, count, seed, distribution="uniform", param=None):
+    save_numbers(path, generate_values(count, seed, distribution, param))
+    return path, count
+
+def clear_generated(folder):
+    for old in glob.glob(os.path.join(folder, GEN_PREFIX + "*")):
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+
+def generate_corpus(folder, file_count, base_count, seed=None, fmt="txt", step=GEN_STEP, workers=None, progress=None,
+                    distribution="uniform", param=None):
+    seed = random.randrange(2**32) if seed is None else seed
+    os.makedirs(folder, exist_ok=True)
+    clear_generated(folder)
+    ext = BINARY_EXT if fmt in ("nsb", BINARY_EXT) else ".txt"
+    jobs = [(os.path.join(folder, f"{GEN_PREFIX}{i + 1}{ext}"), base_count + i * step, file_seed(seed, i)) for i in range(file_count)]
+    done = []
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers or default_workers(), file_count), mp_context=ctx) as pool:
+        for fut in as_completed([pool.submit(generate_file, *job, distribution, param) for job in jobs]):
+            done.append(fut.result())
+            if progress:
+                progress(len(done) / file_count, *done[-1])
+    return seed, [(path, count) for path, count, _ in jobs]
+
+# ----------------- External Sort ----------------- #
+BYTES_PER_NUMBER = 48  # boxed int plus list slots for the chunk and the algorithm's working copy
+MERGE_BUFFER_MIN = 1024
+
+def write_run(result, f):
+    code = number_code(result)
+    if np is not None and isinstance(result, np.ndarray):
+        result.astype(NP_CODES[code]).tofile(f)
+    else:
+        array(code, result).tofile(f)
+    return code
+
+def iter_run(path, buffer_count, code="q"):
+    with open(path, "rb") as f:
+        while True:
+            buf = array(code)
+            try:
+                buf.fromfile(f, buffer_count)
+            except EOFError:  # short final read still fills buf
+                pass
+            if not buf:
+                return
+            yield from buf
+
+def external_sort(in_path, out_path, algorithm="Merge Sort", memory_mb=64, progress=None, tmp_dir=None):
+    func = SORT_FUNCTIONS[algorithm]
+    prepare, sort_chunk = getattr(func, "prepare", as_list), getattr(func, "inplace", func)
+    max_count = max(MERGE_BUFFER_MIN, int(memory_mb * 2**20) // BYTES_PER_NUMBER)
+    start, runs, count = time.perf_counter(), [], 0
+    with tempfile.TemporaryDirectory(prefix="extsort_", dir=tmp_dir) as tmp:
+        split_progress = (lambda frac: progress("split", frac)) if progress else None
+        for chunk in read_number_chunks(in_path, max_count, progress=split_progress):
+            run_path = os.path.join(tmp, f"run_{len(runs)}.bin")
+            with open(run_path, "wb") as f:
+                runs.append((run_path, write_run(sort_chunk(prepare(chunk)), f)))
+            count += len(chunk)
+            del chunk
+        # Each run gets an equal share of the memory budget as its read buffer
+        buffer_count = max(MERGE_BUFFER_MIN, max_count // (len(runs) + 1))
+        merged = heapq.merge(*(iter_run(p, buffer_count, code) for p, code in runs))
+        merge_progress = (lambda frac: progress("merge", frac)) if progress else None
+        if is_binary(out_path):
+            # Int runs merged with float runs come out as floats, as in the text output
+            dtype = "float64" if any(code == "d" for _, code in runs) else "int64"
+            write_binary(out_path, merged, dtype, buffer_count, merge_progress, count)
+        else:
+            write_numbers(out_path, merged, buffer_count, merge_progress, count)
+        if progress:
+            progress("merge", 1.0)
+    return {"count": count, "runs": len(runs), "algorithm": algorithm, "seconds": time.perf_counter() - start}
+
+RESULT_FIELDS = ["dataset", "size", "algorithm", "stable", "distribution", "fingerprint", "min", "median", "p95", "stddev", "mean", "runs", "verified",
+                 "input_runs", "input_longest_run", "input_inversions", "input_inversion_ratio",
+                 "peak_bytes", "gc_collections", "comparisons", "writes", "error"]
+
+def write_results(records, path="-", fmt="json"):
+    f = sys.stdout if path == "-" else open(path, "w", newline="")
+    try:
+        if fmt == "csv":
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(records)
+        else:
+            json.dump(records, f, indent=2)
+            f.write("\n")
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+# ----------------- Scaling Sweep ----------------- #
+COMPLEXITY_MODELS = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log2(n),
+    "n²": lambda n: n * n,
+}
+
+def geometric_sizes(start, stop, per_decade=2):
+    sizes, k = [], 0
+    while True:
+        n = int(round(start * 10 ** (k / per_decade)))
+        if n > stop:
+            return sizes
+        if not sizes or n != sizes[-1]:
+            sizes.append(n)
+        k += 1
+
+def fit_scaling(points):
+    # points: [(n, seconds)]; fits log t = e log n + b and t = c f(n) for each complexity model
+    pts = [(n, t) for n, t in points if n > 1 and t > 0]
+    if len(pts) < 2:
+        return None
+    xs, ys = [math.log(n) for n, _ in pts], [math.log(t) for _, t in pts]
+    mx, my = statistics.fmean(xs), statistics.fmean(ys)
+    slope = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum((x - mx) ** 2 for x in xs)
+    models = {}
+    for name, f in COMPLEXITY_MODELS.items():
+        logs = [math.log(t) - math.log(f(n)) for n, t in pts]
+        log_c = statistics.fmean(logs)
+        models[name] = {"c": math.exp(log_c), "rmse": math.sqrt(statistics.fmean([(v - log_c) ** 2 for v in logs]))}
+    best = min(models, key=lambda m: models[m]["rmse"])
+    return {"exponent": slope, "coef": math.exp(my - slope * mx), "model": best, "models": models}
+
+def predict_seconds(fit, n):
+    return fit["models"][fit["model"]]["c"] * COMPLEXITY_MODELS[fit["model"]](n)
+
+def scaling_sweep(algorithms, sizes, budget=5.0, distribution="uniform", param=None, seed=None,
+                  repeat=3, warmup=0, progress=None):
+    seed = random.randrange(2**32) if seed is None else seed
+    data, sweep, total, done = {}, {}, len(algorithms) * len(sizes), 0
+    for i, alg in enumerate(algorithms):
+        points, stopped = [], None
+        for k, n in enumerate(sizes):
+            if n not in data:
+                data[n] = generate_values(n, seed, distribution, param)
+            try:
+                stats, _ = time_sort(SORT_FUNCTIONS[alg], data[n], repeat, warmup)
+            except Exception as e:
+                stopped = {"size": n, "reason": f"{type(e).__name__}: {e}"}
+                break
+            points.append({"size": n, **stats})
+            done += 1
+            if progress:
+                progress(done / total, alg, points[-1])
+            if k + 1 == len(sizes):
+                break
+            # Stop once the budget is passed, or when the local slope says the next size would pass it
+            t, nxt = stats["median"], sizes[k + 1]
+            local = fit_scaling([(p["size"], p["median"]) for p in points[-2:]])
+            projected = t * (nxt / n) ** (local["exponent"] if local else 1)
+            if t > budget or projected > budget:
+                stopped = {"size": nxt, "reason": f"over {budget:g}s budget (projected {projected:.1f}s)"}
+                break
+        done = (i + 1) * len(sizes)  # sizes skipped after a stop still count towards progress
+        sweep[alg] = {"points": points, "fit": fit_scaling([(p["size"], p["median"]) for p in points]), "stopped": stopped}
+    return sweep
+
+def sweep_summary(sweep, predict=None):
+    lines = []
+    for alg, res in sweep.items():
+        fit = res["fit"]
+        if fit is None:
+            line = f"{alg}: not enough points to fit"
+        else:
+            line = f"{alg}: t ∝ n^{fit['exponent']:.2f}, best model O({fit['model']})"
+            if predict:
+                line += f", predicted {predict_seconds(fit, predict):.2f}s at n={predict}"
+        if res["stopped"]:
+            line += f" [stopped before n={res['stopped']['size']}: {res['stopped']['reason']}]"
+        lines.append(line)
+    return "\n".join(lines)
+
+def draw_scaling(sweep):
+    plt = load_pyplot()
+    plt.figure(figsize=(9, 6))
+    for alg, res in sweep.items():
+        ns = [p["size"] for p in res["points"]]
+        ts = [p["median"] for p in res["points"]]
+        if not ns:
+            continue
+        fit = res["fit"]
+        label = alg if fit is None else f"{alg} (n^{fit['exponent']:.2f})"
+        line, = plt.loglog(ns, ts, "o", label=label)
+        if fit is not None:
+            plt.loglog(ns, [fit["coef"] * n ** fit["exponent"] for n in ns], "-", color=line.get_color(), alpha=0.6)
+    plt.xlabel("n")
+    plt.ylabel("Median time (s)")
+    plt.title("Empirical Scaling (log-log)")
+    plt.grid(True, which="both", alpha=0.3)
+    plt.legend()
+    return plt
+
+# ----------------- Benchmark History ----------------- #
+HISTORY_DB = "bench_history.sqlite"
+REGRESSION_ALPHA, REGRESSION_THRESHOLD = 0.05, 0.05  # significance level, minimum median slowdown
+FILE_DISTRIBUTION = "file"  # distribution of loaded datasets; only generated ones may match by shape
+EXIT_REGRESSION, EXIT_NO_BASELINE = 1, 3  # 'history compare' exit codes, distinct so CI can tell them apart
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created TEXT NOT NULL,
+    label TEXT,
+    machine_id TEXT NOT NULL,
+    machine TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    algorithm TEXT NOT NULL,
+    dataset TEXT,
+    fingerprint TEXT,
+    size INTEGER,
+    distribution TEXT,
+    min REAL, median REAL, p95 REAL, stddev REAL, mean REAL, runs INTEGER,
+    samples TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS results_fingerprint ON results(fingerprint, algorithm);
+"""
+HISTORY_COLUMNS = ["algorithm", "dataset", "fingerprint", "size", "distribution", "min", "median", "p95", "stddev", "mean", "runs"]
+
+def dataset_fingerprint(numbers):
+    # One canonical encoding whatever the container (list, ndarray, mapped .nsb): a type tag, then the values
+    # as little-endian int64 or float64, so the same numbers always get the same fingerprint
+    h, code = hashlib.blake2b(digest_size=8), number_code(numbers)
+    h.update(code.encode())
+    if np is not None and isinstance(numbers, np.ndarray):
+        h.update(np.ascontiguousarray(numbers, dtype=NP_CODES[code]).tobytes())
+        return h.hexdigest()
+    for chunk in iter_batches(numbers):
+        try:
+            block = array(code, chunk)
+        except (OverflowError, TypeError):
+            h.update(repr(chunk).encode())
+            continue
+        if sys.byteorder == "big":
+            block.byteswap()
+        h.update(block.tobytes())
+    return h.hexdigest()
+
+def machine_info():
+    info = {
+        "node": platform.node(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__ if np is not None else None,
+    }
+    return info, hashlib.blake2b(json.dumps(info, sort_keys=True).encode(), digest_size=6).hexdigest()
+
+def open_history(path=HISTORY_DB):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(HISTORY_SCHEMA)
+    return conn
+
+@contextlib.contextmanager
+def history_db(path=HISTORY_DB):
+    conn = open_history(path)
+    try:
+        with conn:  # commits on success, rolls back on error
+            yield conn
+    finally:
+        conn.close()
+
+def record_run(records, path=HISTORY_DB, label=None):
+    info, machine_id = machine_info()
+    with history_db(path) as conn:
+        run_id = conn.execute("INSERT INTO runs (created, label, machine_id, machine) VALUES (?, ?, ?, ?)",
+                              (datetime.datetime.now().isoformat(timespec="seconds"), label, machine_id, json.dumps(info))).lastrowid
+        for rec in records:
+            if "error" in rec:
+                continue
+            extra = {k: v for k, v in rec.items() if k not in HISTORY_COLUMNS and k != "samples"}
+            conn.execute(f"INSERT INTO results (run_id, {', '.join(HISTORY_COLUMNS)}, samples, extra) VALUES (?{', ?' * (len(HISTORY_COLUMNS) + 2)})",
+                         [run_id] + [rec.get(c) for c in HISTORY_COLUMNS] + [json.dumps(rec.get("samples", [])), json.dumps(extra)])
+    return run_id
+
+def list_runs(path=HISTORY_DB, limit=20):
+    with history_db(path) as conn:
+        rows = conn.execute("""SELECT runs.*, COUNT(results.run_id) AS results FROM runs LEFT JOIN results ON results.run_id = runs.id
+                               GROUP BY runs.id ORDER BY runs.id DESC LIMIT ?""", (limit,)).fetchall()
+    return [dict(r) for r in rows]
+
+def latest_run_id(path=HISTORY_DB):
+    runs = list_runs(path, 1)
+    if not runs:
+        raise ValueError(f"no runs stored in {path}")
+    return runs[0]["id"]
+
+def load_run(run_id, path=HISTORY_DB):
+    with history_db(path) as conn:
+        run = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        if run is None:
+            raise ValueError(f"no run with id {run_id}")
+        results = [dict(r, samples=json.loads(r["samples"] or "[]")) for r in conn.execute("SELECT * FROM results WHERE run_id = ?", (run_id,))]
+    return dict(run), results
+
+def find_baseline(run_id, path=HISTORY_DB):
+    # Most recent earlier run that timed any of the same datasets, else (like compare_runs) the same
+    # algorithm on the same generated distribution and size, which is what unseeded datasets share.
+    # Files only ever match by fingerprint: two files of one size say nothing about each other.
+    with history_db(path) as conn:
+        row = conn.execute("""SELECT MAX(b.run_id) FROM results b JOIN results c ON b.fingerprint = c.fingerprint
+                              WHERE c.run_id = ? AND b.run_id < ?""", (run_id, run_id)).fetchone()
+        if row[0] is None:
+            row = conn.execute("""SELECT MAX(b.run_id) FROM results b JOIN results c ON b.algorithm = c.algorithm
+                                  AND b.distribution = c.distribution AND b.size = c.size
+                                  WHERE c.run_id = ? AND b.run_id < ? AND c.distribution != ?""",
+                               (run_id, run_id, FILE_DISTRIBUTION)).fetchone()
+    return row[0]
+
+def mann_whitney_greater(base, cand):
+    # One-sided Mann-Whitney U test (normal approximation, tie corrected): p-value for "cand is slower"
+    n1, n2 = len(base), len(cand)
+    if n1 < 2 or n2 < 2:
+        return None
+    values = sorted([(v, 0) for v in base] + [(v, 1) for v in cand])
+    ranks, i, ties = [0.0] * len(values), 0, 0.0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and values[j + 1][0] == values[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    n = n1 + n2
+    u = sum(r for r, (_, group) in zip(ranks, values) if group == 1) - n2 * (n2 + 1) / 2
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1))))
+    if sigma == 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / sigma
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def compare_runs(baseline_id, candidate_id, path=HISTORY_DB, alpha=REGRESSION_ALPHA, threshold=REGRESSION_THRESHOLD):
+    _, base = load_run(baseline_id, path)
+    _, cand = load_run(candidate_id, path)
+    by_fp = {(r["algorithm"], r["fingerprint"]): r for r in base}
+    by_shape = {(r["algorithm"], r["distribution"], r["size"]): r for r in base if r["distribution"] != FILE_DISTRIBUTION}
+    rows = []
+    for c in cand:
+        b = by_fp.get((c["algorithm"], c["fingerprint"])) or by_shape.get((c["algorithm"], c["distribution"], c["size"]))
+        if b is None or not b["median"]:
+            continue
+        ratio = c["median"] / b["median"]
+        p = mann_whitney_greater(b["samples"], c["samples"])
+        rows.append({
+            "algorithm": c["algorithm"], "dataset": c["dataset"], "size": c["size"],
+            "baseline": b["median"], "candidate": c["median"], "ratio": ratio, "p_value": p,
+            "regression": p is not None and p < alpha and ratio > 1 + threshold,
+        })
+    return rows
+
+def comparison_table(rows, baseline_id, candidate_id):
+    lines = [f"Run {candidate_id} vs baseline {baseline_id}",
+             f"{'Algorithm':<20}{'size':>10}{'base (s)':>11}{'new (s)':>11}{'change':>9}{'p':>8}"]
+    for r in rows:
+        p = "-" if r["p_value"] is None else f"{r['p_value']:.3f}"
+        flag = "  ⚠️ SLOWER" if r["regression"] else ""
+        lines.append(f"{r['algorithm']:<20}{r['size']:>10}{r['baseline']:>11.4f}{r['candidate']:>11.4f}{r['ratio'] - 1:>+9.1%}{p:>8}{flag}")
+    if not rows:
+        lines.append("(no matching results)")
+    return "\n".join(lines)
+
+# ----------------- Dataset Cache ----------------- #
+CACHE_DIR = os.path.join(os.getcwd(), ".sort_cache")
+CACHE_MEMORY_ITEMS = 8
+CACHE_DISK_MB = 512
+
+def file_digest(path, block_size=READ_BLOCK):
+    h = hashlib.blake2b(digest_size=8)
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            h.update(block)
+    return h.hexdigest()
+
+class DatasetCache:
+    # Content-addressed: keys are hashes of file bytes (loaded files) or of the values (generated data).
+    # Each entry holds the parsed numbers, the reference sorted output and per-algorithm timings.
+    def __init__(self, disk_dir=None, max_items=CACHE_MEMORY_ITEMS, disk_limit_mb=CACHE_DISK_MB):
+        self.disk_dir, self.max_items, self.disk_limit = disk_dir, max_items, int(disk_limit_mb * 2**20)
+        self.entries = OrderedDict()
+        self.paths = {}  # absolute path -> (mtime_ns, size, key)
+        self.machine_id = machine_info()[1]  # timings persist on disk, so they are only reused on the same machine
+        self.lock = threading.RLock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _entry(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = {"numbers": None, "reference": None, "timings": self._load_timings(key)}
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_items:
+                self.entries.popitem(last=False)
+            return entry
+
+    def _disk(self, key, suffix):
+        return os.path.join(self.disk_dir, key + suffix) if self.disk_dir else None
+
+    def file_key(self, path):
+        path, st = os.path.abspath(path), os.stat(path)
+        with self.lock:
+            known = self.paths.get(path)
+            if known and known[:2] == (st.st_mtime_ns, st.st_size):
+                return known[2]
+        key = file_digest(path)
+        with self.lock:
+            self.paths[path] = (st.st_mtime_ns, st.st_size, key)
+        return key
+
+    def key_for(self, numbers):
+        return dataset_fingerprint(numbers)
+
+    def invalidate_path(self, path):
+        with self.lock:
+            known = self.paths.pop(os.path.abspath(path), None)
+            if known:
+                self.entries.pop(known[2], None)
+
+    def invalidate_folder(self, folder):
+        folder = os.path.abspath(folder)
+        with self.lock:
+            for path in [p for p in self.paths if os.path.dirname(p) == folder]:
+                self.invalidate_path(path)
+
+    def get_numbers(self, key):
+        entry = self._entry(key)
+        if entry["numbers"] is None:
+            path = self._disk(key, BINARY_EXT)
+            if path and os.path.exists(path):
+                os.utime(path)
+                entry["numbers"] = load_binary(path)[0]
+        return entry["numbers"]
+
+    def put_numbers(self, key, numbers):
+        self._entry(key)["numbers"] = numbers
+        self._store(key, BINARY_EXT, numbers)
+
+    def reference(self, key, numbers):
+        entry = self._entry(key)
+        if entry["reference"] is None:
+            path = self._disk(key, ".sorted" + BINARY_EXT)
+            if path and os.path.exists(path):
+                os.utime(path)
+                entry["reference"] = load_binary(path)[0]
+            else:
+                entry["reference"] = np.sort(np.asarray(numbers)) if np is not None else sorted(as_list(numbers))
+                self._store(key, ".sorted" + BINARY_EXT, entry["reference"])
+        return entry["reference"]
+
+    def _timing_key(self, alg, repeat, warmup):
+        key = f"{alg}|{repeat}|{warmup}|{self.machine_id}"
+        # Parallel sorts scale with the worker count, which can change between runs
+        return f"{key}|{parallel_workers()}w" if alg in PARALLEL_BASELINES else key
+
+    def get_timing(self, key, alg, repeat, warmup):
+        return self._entry(key)["timings"].get(self._timing_key(alg, repeat, warmup))
+
+    def put_timing(self, key, alg, repeat, warmup, stats):
+        entry = self._entry(key)
+        entry["timings"][self._timing_key(alg, repeat, warmup)] = stats
+        path = self._disk(key, ".json")
+        if path:
+            with open(path, "w") as f:
+                json.dump(entry["timings"], f)
+            self._evict_disk()
+
+    def _load_timings(self, key):
+        path = self._disk(key, ".json")
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {}
+
+    def _store(self, key, suffix, values):
+        path = self._disk(key, suffix)
+        if path is None or os.path.exists(path):
+            return
+        try:
+            write_binary(path + ".tmp", values, number_dtype(values))
+            os.replace(path + ".tmp", path)
+        except (OSError, ValueError):
+            return  # values that do not fit the binary format simply stay memory-only
+        self._evict_disk()
+
+    def _evict_disk(self):
+        # Least recently used first: reads touch files, so mtime tracks last use
+        files = [os.path.join(self.disk_dir, f) for f in os.listdir(self.disk_dir)]
+        files = sorted((os.stat(p).st_mtime, os.path.getsize(p), p) for p in files if os.path.isfile(p))
+        total = sum(size for _, size, _ in files)
+        for _, size, p in files:
+            if total <= self.disk_limit:
+                break
+            try:
+                os.remove(p)
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.paths.clear()
+        if self.disk_dir:
+            for f in os.listdir(self.disk_dir):
+                try:
+                    os.remove(os.path.join(self.disk_dir, f))
+                except OSError:
+                    pass
+
+    def load(self, path, progress=None):
+        key = self.file_key(path)
+        numbers = self.get_numbers(key)
+        if numbers is None:
+            numbers = load_numbers(path, progress)
+            self.put_numbers(key, numbers)
+        elif progress:
+            progress(1.0)
+        return key, numbers
+
 # ----------------- Main App ----------------- #
 class SortingApp:
     def __init__(self, root):
@@ -137,6 +2085,13 @@ class SortingApp:
         self.root.configure(fg_color="#2C3E50")
 
         self.numbers, self.results, self.sorted_data = [], {}, []
+        self.records = None  # (header, rows, shift) while self.numbers holds decorated record keys
+        self.data_source, self.last_run_id = "input", None
+        self.distribution = FILE_DISTRIBUTION  # or the generator's label for generated data
+        self.cache, self.cache_key = DatasetCache(disk_dir=CACHE_DIR), None
+        self.scheduler = None
+        self.external_cancel = None  # threading.Event while an external sort runs
+        self.sweep_cancel = None     # threading.Event while a scaling sweep runs
         self.algorithms = list(SORT_FUNCTIONS.keys())
         self.generated_folder = os.path.join(os.getcwd(), "generated_files")
         self.theme, self.font_size, self.bg_color = "dark", 12, "#2C3E50"
@@ -144,9 +2099,13 @@ class SortingApp:
         ctk.set_appearance_mode(self.theme)
         ctk.set_default_color_theme("blue")
 
+        # Worker threads hand UI updates to the Tk main loop through this queue
+        self.ui_queue = queue.Queue()
+
         self.load_settings()
         self.create_widgets()
         self.update_clock()
+        self.drain_ui_queue()
 
     # ----------------- GUI ----------------- #
     def create_widgets(self):
@@ -177,6 +2136,9 @@ class SortingApp:
         btn_frame.pack(fill="x", pady=5, padx=8)
         ctk.CTkButton(btn_frame, text="📂 Load File", fg_color="#FFD700", text_color="black", command=self.load_file).pack(side="left", padx=6, pady=6)
         ctk.CTkButton(btn_frame, text="💾 Save Input", fg_color="#EF8FCA", text_color="white", command=self.save_input_file).pack(side="left", padx=6, pady=6)
+        ctk.CTkLabel(btn_frame, text="CSV key column:").pack(side="left", padx=4)
+        self.key_entry = ctk.CTkEntry(btn_frame, placeholder_text="0", width=100)
+        self.key_entry.pack(side="left", padx=4)
 
         gen_frame = ctk.CTkFrame(data_tab, fg_color="#3B5360")
         gen_frame.pack(fill="x", pady=8, padx=8)
@@ -184,6 +2146,11 @@ class SortingApp:
         self.num_entry = ctk.CTkEntry(gen_frame, placeholder_text="10000", width=120)
         self.num_entry.grid(row=0, column=1, padx=4)
         ctk.CTkButton(gen_frame, text="🎲 Generate", fg_color="#27AE60", text_color="white", command=self.generate_numbers).grid(row=0, column=2, padx=4)
+        ctk.CTkLabel(gen_frame, text="Distribution:").grid(row=0, column=3, padx=4)
+        self.dist_var = ctk.StringVar(value="uniform")
+        ctk.CTkOptionMenu(gen_frame, values=list(DISTRIBUTIONS), variable=self.dist_var, width=120, command=self._update_param_hint).grid(row=0, column=4, padx=4)
+        self.param_entry = ctk.CTkEntry(gen_frame, placeholder_text="no parameter", width=110)
+        self.param_entry.grid(row=0, column=5, padx=4)
 
         self.file_label = ctk.CTkLabel(data_tab, text="No file loaded")
         self.file_label.pack(anchor="w", padx=12, pady=4)
@@ -200,6 +2167,12 @@ class SortingApp:
         self.numbers_per_file_entry.grid(row=0, column=3, padx=4)
         ctk.CTkButton(file_frame, text="📁 Generate Files", fg_color="#2980B9", text_color="white", command=self.generate_files).grid(row=0, column=4, padx=6)
         ctk.CTkButton(file_frame, text="📂 Open Folder", fg_color="#8E44AD", text_color="white", command=self.open_generated_folder).grid(row=0, column=5, padx=6)
+        ctk.CTkLabel(file_frame, text="Seed:").grid(row=1, column=0, padx=4, pady=6)
+        self.seed_entry = ctk.CTkEntry(file_frame, placeholder_text="random", width=80)
+        self.seed_entry.grid(row=1, column=1, padx=4)
+        ctk.CTkLabel(file_frame, text="Format:").grid(row=1, column=2, padx=4)
+        self.format_var = ctk.StringVar(value="txt")
+        ctk.CTkOptionMenu(file_frame, values=["txt", "nsb"], variable=self.format_var, width=100).grid(row=1, column=3, padx=4)
 
         ctk.CTkLabel(data_tab, text="Preview (first 20 numbers):").pack(anchor="w", padx=12, pady=4)
         self.preview_box = ctk.CTkTextbox(data_tab, height=80, fg_color="#2E4053")
@@ -211,12 +2184,48 @@ class SortingApp:
         algo_frame.pack(pady=6, fill="x", padx=8)
         self.algo_vars = {alg: ctk.BooleanVar(value=True) for alg in self.algorithms}
         for i, alg in enumerate(self.algorithms):
-            ctk.CTkCheckBox(algo_frame, text=alg, variable=self.algo_vars[alg]).grid(row=0, column=i, padx=5, pady=6)
+            ctk.CTkCheckBox(algo_frame, text=alg, variable=self.algo_vars[alg]).grid(row=i // 6, column=i % 6, padx=5, pady=6)
 
         action_frame = ctk.CTkFrame(sort_tab, fg_color="#3B5360")
         action_frame.pack(pady=10)
         ctk.CTkButton(action_frame, text="⚡ Sort Now", fg_color="#7EA1BD", text_color="white", command=self.run_sorting).grid(row=0, column=0, padx=6, pady=6)
         ctk.CTkButton(action_frame, text="💾 Save Sorted Output", fg_color="#8A2BE2", text_color="white", command=self.save_sorted_output).grid(row=0, column=1, padx=6, pady=6)
+        ctk.CTkLabel(action_frame, text="Runs:").grid(row=0, column=2, padx=4)
+        self.repeat_entry = ctk.CTkEntry(action_frame, placeholder_text=str(DEFAULT_REPEAT), width=60)
+        self.repeat_entry.grid(row=0, column=3, padx=4)
+        ctk.CTkLabel(action_frame, text="Warmup:").grid(row=0, column=4, padx=4)
+        self.warmup_entry = ctk.CTkEntry(action_frame, placeholder_text=str(DEFAULT_WARMUP), width=60)
+        self.warmup_entry.grid(row=0, column=5, padx=4)
+
+        self.parallel_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(action_frame, text=f"Parallel ({default_workers()} cores)", variable=self.parallel_var).grid(row=1, column=0, columnspan=2, padx=6, pady=6)
+        self.memory_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(action_frame, text="Measure memory", variable=self.memory_var).grid(row=2, column=0, columnspan=2, padx=6, pady=6)
+        self.count_ops_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(action_frame, text="Count operations", variable=self.count_ops_var).grid(row=2, column=2, columnspan=2, padx=6, pady=6)
+        self.reuse_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(action_frame, text="Reuse cached timings", variable=self.reuse_var).grid(row=2, column=4, columnspan=2, padx=6, pady=6)
+        ctk.CTkButton(action_frame, text="🗄️ External Sort File", fg_color="#D35400", text_color="white", command=self.run_external_sort).grid(row=1, column=2, columnspan=2, padx=6, pady=6)
+        ctk.CTkLabel(action_frame, text="Memory MB:").grid(row=1, column=4, padx=4)
+        self.memory_entry = ctk.CTkEntry(action_frame, placeholder_text="64", width=60)
+        self.memory_entry.grid(row=1, column=5, padx=4)
+        ctk.CTkLabel(action_frame, text="Chunk algorithm:").grid(row=5, column=2, padx=4)
+        self.chunk_algo_var = ctk.StringVar(value="Hybrid Sort")
+        ctk.CTkOptionMenu(action_frame, values=list(SORT_FUNCTIONS), variable=self.chunk_algo_var, width=180).grid(row=5, column=3, columnspan=3, padx=4, pady=6)
+        ctk.CTkButton(action_frame, text="📈 Scaling Sweep", fg_color="#C0392B", text_color="white", command=self.run_sweep).grid(row=3, column=0, columnspan=2, padx=6, pady=6)
+        ctk.CTkLabel(action_frame, text="Up to n:").grid(row=3, column=2, padx=4)
+        self.sweep_max_entry = ctk.CTkEntry(action_frame, placeholder_text="1000000", width=90)
+        self.sweep_max_entry.grid(row=3, column=3, padx=4)
+        ctk.CTkLabel(action_frame, text="Budget s:").grid(row=3, column=4, padx=4)
+        self.budget_entry = ctk.CTkEntry(action_frame, placeholder_text="2", width=60)
+        self.budget_entry.grid(row=3, column=5, padx=4)
+        ctk.CTkButton(action_frame, text="🛑 Cancel", fg_color="#7F8C8D", text_color="white", command=self.cancel_sorting).grid(row=4, column=0, columnspan=2, padx=6, pady=6)
+        ctk.CTkLabel(action_frame, text="Timeout s:").grid(row=4, column=2, padx=4)
+        self.timeout_entry = ctk.CTkEntry(action_frame, placeholder_text=f"{JOB_TIMEOUT:g}", width=60)
+        self.timeout_entry.grid(row=4, column=3, padx=4)
+        ctk.CTkLabel(action_frame, text="Workers:").grid(row=4, column=4, padx=4)
+        self.sort_workers_entry = ctk.CTkEntry(action_frame, placeholder_text=str(parallel_workers()), width=60)
+        self.sort_workers_entry.grid(row=4, column=5, padx=4)
 
         self.progress = ctk.CTkProgressBar(sort_tab, width=500)
         self.progress.pack(pady=8)
@@ -230,6 +2239,8 @@ class SortingApp:
         btn_frame2.pack(pady=8)
         ctk.CTkButton(btn_frame2, text="📊 Show Graph", fg_color="#E67E22", text_color="white", command=self.plot_results).pack(side="left", padx=6, pady=6)
         ctk.CTkButton(btn_frame2, text="💾 Save Graph as PNG", fg_color="#16A085", text_color="white", command=self.save_graph).pack(side="left", padx=6, pady=6)
+        ctk.CTkButton(btn_frame2, text="📤 Export Results", fg_color="#2C3E50", text_color="white", command=self.export_results).pack(side="left", padx=6, pady=6)
+        ctk.CTkButton(btn_frame2, text="🕘 Compare History", fg_color="#7F8C8D", text_color="white", command=self.show_history).pack(side="left", padx=6, pady=6)
 
         # Status bar & clock
         bottom_frame = ctk.CTkFrame(self.root, fg_color="#1A252F")
@@ -265,9 +2276,9 @@ class SortingApp:
             pass
 
     def clear_data(self):
-        self.numbers.clear()
+        self.numbers, self.records = [], None
         self.results.clear()
-        self.sorted_data.clear()
+        self.sorted_data = []
         self.preview_box.delete("1.0", END)
         self.info.delete("1.0", END)
         self.file_label.configure(text="No file loaded")
@@ -285,6 +2296,20 @@ class SortingApp:
         self.save_settings()
         self.log("🔄 App reset to defaults")
 
+    def post(self, func, *args, **kwargs):
+        self.ui_queue.put((func, args, kwargs))
+
+    def drain_ui_queue(self):
+        # Spends at most half a frame on queued updates; anything left waits for the next tick
+        deadline = time.perf_counter() + UI_FRAME_MS / 2000
+        try:
+            while time.perf_counter() < deadline:
+                func, args, kwargs = self.ui_queue.get_nowait()
+                func(*args, **kwargs)
+        except queue.Empty:
+            pass
+        self.root.after(UI_FRAME_MS, self.drain_ui_queue)
+
     def update_clock(self):
         now = datetime.datetime.now().strftime("%H:%M:%S")
         self.clock.configure(text=f"⏰ {now}")
@@ -323,74 +2348,159 @@ class SortingApp:
             pass
 
     def load_file(self):
-        path = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt")])
-        if path:
+        path = filedialog.askopenfilename(filetypes=NUMBER_FILETYPES + RECORD_FILETYPES)
+        if not path:
+            return
+        name = os.path.basename(path)
+        self.progress.set(0)
+        self.preview_box.delete("1.0", END)
+        if is_records(path):
+            return self.load_record_file(path)
+        if is_binary(path):
             try:
-                with open(path, "r") as f:
-                    self.numbers = list(map(int, f.read().split()))
-                self.file_label.configure(text=f"Loaded {len(self.numbers)} numbers from {os.path.basename(path)}")
-                self.preview_box.delete("1.0", END)
-                self.preview_box.insert("1.0", " ".join(map(str, self.numbers[:20])))
-                self.log(f"✅ Loaded {len(self.numbers)} numbers")
+                self.numbers, header = load_binary(path)
+                self.data_source, self.cache_key, self.records = name, None, None
+                self.distribution = FILE_DISTRIBUTION
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to load file: {e}")
+                return messagebox.showerror("Error", f"Failed to load file: {e}")
+            self.preview_box.insert("1.0", " ".join(map(str, as_list(self.numbers[:20]))))
+            self.file_label.configure(text=f"Mapped {header['count']} {header['dtype']} numbers from {name}" + (" (sorted)" if header["sorted"] else ""))
+            self.progress.set(1)
+            self.log(f"✅ Loaded {header['count']} numbers")
+            return self.log_presortedness()
+        def worker():
+            blocks, count = [], 0
+            try:
+                key = self.cache.file_key(path)
+                cached = self.cache.get_numbers(key)
+                if cached is not None:
+                    self.numbers, self.data_source, self.cache_key, self.records = cached, name, key, None
+                    self.distribution = FILE_DISTRIBUTION
+                    self.post(self.preview_box.insert, "1.0", " ".join(map(str, as_list(cached[:20]))))
+                    self.post(self.file_label.configure, text=f"Loaded {len(cached)} numbers from {name} (cached)")
+                    self.post(self.progress.set, 1)
+                    self.post(self.log, f"✅ Loaded {len(cached)} numbers from cache")
+                    return self.log_presortedness()
+                for block in iter_number_blocks(path, progress=lambda frac: self.post(self.progress.set, frac)):
+                    if not count and block:
+                        self.post(self.preview_box.insert, "1.0", " ".join(map(str, block[:20])))
+                    blocks.append(block)
+                    count += len(block)
+                    self.post(self.file_label.configure, text=f"Loading {name}... {count} numbers")
+                numbers = join_blocks(blocks)
+                self.numbers, self.data_source, self.cache_key, self.records = numbers, name, key, None
+                self.distribution = FILE_DISTRIBUTION
+                self.post(self.file_label.configure, text=f"Loaded {len(numbers)} numbers from {name}")
+                self.post(self.log, f"✅ Loaded {len(numbers)} numbers")
+                self.cache.put_numbers(key, numbers)
+                self.log_presortedness()
+            except Exception as e:
+                self.post(messagebox.showerror, "Error", f"Failed to load file: {e}")
+        threading.Thread(target=worker, daemon=True).start()
 
-    def save_input_file(self):
-        if not self.numbers:
-            return messagebox.showwarning("No Data", "Nothing to save")
-        path = filedialog.asksaveasfilename(defaultextension=".txt")
-        if path:
+    def load_record_file(self, path):
+        key, name = self.key_entry.get().strip() or "0", os.path.basename(path)
+        def worker():
             try:
-                with open(path, "w") as f:
-                    f.write(" ".join(map(str, self.numbers)))
-                self.log(f"💾 Input saved to {path}")
+                header, rows, keys = load_records(path, key)
+                # Algorithms sort the decorated keys; the rows themselves only move once, when saved
+                self.numbers, shift = decorate(keys)
+                self.records, self.data_source, self.cache_key = (header, rows, shift), name, None
+                self.distribution = FILE_DISTRIBUTION
+                self.post(self.preview_box.insert, "1.0", " ".join(map(str, keys[:20])))
+                self.post(self.file_label.configure, text=f"Loaded {len(rows)} records from {name}, keyed on column {key!r}")
+                self.post(self.progress.set, 1)
+                self.post(self.log, f"✅ Loaded {len(rows)} records ({'float64' if keys and type(keys[0]) is float else 'int64'} keys)")
+                self.log_presortedness()
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to save: {e}")
+                self.post(messagebox.showerror, "Error", f"Failed to load records: {e}")
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _save_numbers(self, values, what):
+        path = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=NUMBER_FILETYPES)
+        if not path:
+            return
+        self.progress.set(0)
+        def worker():
+            try:
+                save_numbers(path, values, progress=lambda frac: self.post(self.progress.set, frac))
+                self.post(self.log, f"💾 {what} saved to {path}")
+            except Exception as e:
+                self.post(messagebox.showerror, "Error", f"Failed to save: {e}")
+        threading.Thread(target=worker).start()
+
+    def save_input_file(self):
+        if len(self.numbers) == 0:
+            return messagebox.showwarning("No Data", "Nothing to save")
+        if self.records is None:
+            return self._save_numbers(self.numbers, "Input")
+        # self.numbers holds decorated keys here, so the input is saved as the records themselves
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=RECORD_FILETYPES)
+        if not path:
+            return
+        header, rows, _ = self.records
+        try:
+            write_records(path, header, rows)
+            self.log(f"💾 Input records saved to {path}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save: {e}")
+
+    def _update_param_hint(self, distribution):
+        _, name, default = DISTRIBUTIONS[distribution]
+        self.param_entry.delete(0, END)
+        self.param_entry.configure(placeholder_text=f"{name} = {default}" if name else "no parameter")
+
+    def _distribution(self):
+        text = self.param_entry.get().strip()
+        return self.dist_var.get(), (float(text) if text else None)
 
     def generate_numbers(self):
         try:
             n = int(self.num_entry.get())
             if n < 10000:
                 raise ValueError
+            distribution, param = self._distribution()
+            self.numbers = generate_values(n, None, distribution, param)
         except Exception:
-            return messagebox.showerror("Error", "Enter valid number ≥10000")
-        self.numbers = [random.randint(1, 10**9) for _ in range(n)]
-        self.file_label.configure(text=f"Generated {n} numbers")
+            return messagebox.showerror("Error", "Enter valid number ≥10000 and a numeric distribution parameter")
+        label = self.data_source = self.distribution = describe_distribution(distribution, param)
+        self.cache_key, self.records = None, None
+        self.file_label.configure(text=f"Generated {n} numbers ({label})")
         self.preview_box.delete("1.0", END)
-        self.preview_box.insert("1.0", " ".join(map(str, self.numbers[:20])))
-        self.log(f"🎲 Generated {n} numbers")
+        self.preview_box.insert("1.0", " ".join(map(str, as_list(self.numbers[:20]))))
+        self.log(f"🎲 Generated {n} {label} numbers")
+        self.log_presortedness()
+
+    def log_presortedness(self):
+        # Safe from worker threads: the measurement runs here, only the log line goes through the UI queue
+        self.post(self.log, f"📐 Input order: {format_presortedness(presortedness(self.numbers))}")
 
     def generate_files(self):
         try:
             file_count = int(self.file_count_entry.get())
             base_num = int(self.numbers_per_file_entry.get())
+            seed = int(self.seed_entry.get()) if self.seed_entry.get().strip() else None
+            distribution, param = self._distribution()
             if file_count < 1 or base_num < 10000:
                 raise ValueError
         except Exception:
-            return messagebox.showerror("Error", "Enter valid integers (files ≥1, numbers ≥10000)")
-
-        os.makedirs(self.generated_folder, exist_ok=True)
-        for old in glob.glob(os.path.join(self.generated_folder, "numbers_file_*.txt")):
-            try:
-                os.remove(old)
-            except:
-                pass
+            return messagebox.showerror("Error", "Enter valid integers (files ≥1, numbers ≥10000, seed optional)")
 
         self.progress.set(0)
+        fmt = self.format_var.get()
+        def progress(frac, path, count):
+            self.post(self.log, f"📁 Generated {os.path.basename(path)}: {count} numbers")
+            self.post(self.progress.set, frac)
+        self.cache.invalidate_folder(self.generated_folder)
         def worker():
             try:
-                for i in range(file_count):
-                    num_this = base_num + i * 15000
-                    nums = [random.randint(1, 10**9) for _ in range(num_this)]
-                    filename = os.path.join(self.generated_folder, f"numbers_file_{i + 1}.txt")
-                    with open(filename, "w") as f:
-                        f.write(" ".join(map(str, nums)))
-                    self.log(f"📁 Generated file {i+1}: {num_this} numbers")
-                    self.progress.set((i + 1) / file_count)
-                self.log(f"✅ All {file_count} files created in {self.generated_folder}")
+                used_seed, _ = generate_corpus(self.generated_folder, file_count, base_num, seed, fmt, progress=progress,
+                                               distribution=distribution, param=param)
+                self.cache.invalidate_folder(self.generated_folder)
+                self.post(self.log, f"✅ All {file_count} files created in {self.generated_folder} (seed {used_seed})")
             except Exception as e:
-                messagebox.showerror("Error", f"Failed during generation: {e}")
-        threading.Thread(target=worker).start()
+                self.post(messagebox.showerror, "Error", f"Failed during generation: {e}")
+        threading.Thread(target=worker, daemon=True).start()
 
     def open_generated_folder(self):
         try:
@@ -402,70 +2512,254 @@ class SortingApp:
             messagebox.showerror("Error", f"Could not open folder: {e}")
 
     def run_sorting(self):
-        if not self.numbers:
+        if len(self.numbers) == 0:
             return messagebox.showwarning("No Data", "Load or generate numbers first")
+        if self.scheduler is not None:
+            return messagebox.showwarning("Busy", "A sort is already running; cancel it first")
         selected = [a for a, v in self.algo_vars.items() if v.get()]
         if not selected:
             return messagebox.showwarning("No Algorithm", "Select at least one algorithm")
+        try:
+            repeat = int(self.repeat_entry.get() or DEFAULT_REPEAT)
+            warmup = int(self.warmup_entry.get() or DEFAULT_WARMUP)
+            timeout = float(self.timeout_entry.get() or JOB_TIMEOUT)
+            sort_workers = int(self.sort_workers_entry.get() or parallel_workers())
+            if repeat < 1 or warmup < 0 or timeout <= 0 or sort_workers < 1:
+                raise ValueError
+        except Exception:
+            return messagebox.showerror("Error", "Runs must be ≥1, warmup ≥0, timeout > 0 and workers ≥1")
+        set_parallel_workers(sort_workers)
+        # Speedup is measured against the single-core kernel each parallel sort runs on
+        baselines = add_baselines(selected)
+        if baselines:
+            self.log(f"➕ Added {', '.join(baselines)} as single-core baseline")
         self.results.clear()
+        self.sorted_data = []
         self.progress.set(0)
         self.info.delete("1.0", END)
+        parallel, memory, count_ops = self.parallel_var.get(), self.memory_var.get(), self.count_ops_var.get()
+        reuse = self.reuse_var.get() and not (memory or count_ops)
+        scheduler = self.scheduler = SortScheduler(self.numbers, selected, repeat, warmup, default_workers() if parallel else 1,
+                                                   timeout, memory, count_ops)
+        def check(key, alg, output, stats):
+            # Only verified output is kept; failures are pinned down against the cached reference sort
+            if stats["verified"]:
+                self.sorted_data = output
+                return
+            reference = self.cache.reference(key, self.numbers)
+            i = first_difference(output, reference)
+            where = f"at index {i}: got {output[i] if i < len(output) else 'nothing'}, expected {reference[i] if i < len(reference) else 'nothing'}"
+            self.post(self.log, f"   ❌ {alg} output differs from the reference sort {where}")
         def worker():
-            self.log("⚡ Sorting started")
+            self.post(self.log, "⚡ Sorting started" + (" in parallel" if parallel else ""))
             try:
-                for i, alg in enumerate(selected):
-                    func = SORT_FUNCTIONS[alg]
-                    start = time.time()
-                    sorted_list = func(self.numbers)
-                    end = time.time()
-                    self.results[alg] = end - start
-                    self.sorted_data = sorted_list
-                    self.log(f"⚡ {alg} finished in {end - start:.3f}s")
-                    self.progress.set((i + 1) / len(selected))
-                self.log("✅ Sorting complete\n")
+                key = self.cache_key = self.cache_key or self.cache.key_for(self.numbers)
+                for alg in selected if reuse else []:
+                    stats = self.cache.get_timing(key, alg, repeat, warmup)
+                    if stats is not None:
+                        self.results[alg] = stats
+                        self.post(self.log, f"♻️ {alg} (cached): {format_stats(stats)}")
+                scheduler.algorithms = [a for a in selected if a not in self.results]
+                # Each job's own fraction counts towards the bar, so long sorts move it too
+                fracs = dict.fromkeys(scheduler.algorithms, 0.0)
+                for kind, alg, payload in scheduler.run():
+                    fracs[alg] = payload if kind == "progress" else float(kind != "start")
+                    self.post(self.progress.set, sum(fracs.values()) / len(fracs))
+                    if kind == "done":
+                        stats, output = payload
+                        self.results[alg] = stats
+                        self.cache.put_timing(key, alg, repeat, warmup, stats)
+                        self.post(self.log, f"⚡ {alg}: {format_stats(stats)}")
+                        check(key, alg, output, stats)
+                    elif kind == "error":
+                        self.post(self.log, f"⚡ {alg}: failed ({payload})")
+                    elif kind == "timeout":
+                        self.post(self.log, f"⏱️ {alg} stopped after {payload:g}s")
+                    elif kind == "cancelled":
+                        self.post(self.log, f"🛑 {alg} cancelled")
+                self.results = {a: self.results[a] for a in selected if a in self.results}
+                self.post(self.log, "🛑 Sorting cancelled\n" if scheduler.cancelled.is_set() else "✅ Sorting complete\n")
+                self.post(self.info.insert, END, results_table(self.results) + "\n")
+                speedups = speedup_report(self.results, sort_workers)
+                if speedups:
+                    self.post(self.info.insert, END, f"\nParallel speedup:\n{speedups}\n\n")
+                if self.results:
+                    self.last_run_id = record_run(self._result_records(), label="gui")
+                    self.post(self.log, f"🕘 Stored as run {self.last_run_id}")
                 ad_text = ""
                 for alg in selected:
                     if alg in self.results:
-                        ad_text += f"{alg}:\n - Advantages: {SORT_INFO[alg]['Advantages']}\n - Disadvantages: {SORT_INFO[alg]['Disadvantages']}\n\n"
-                self.info.insert(END, ad_text)
+                        ad_text += f"{alg} ({stability_label(alg)}):\n - Advantages: {SORT_INFO[alg]['Advantages']}\n - Disadvantages: {SORT_INFO[alg]['Disadvantages']}\n\n"
+                self.post(self.info.insert, END, ad_text)
             except Exception as e:
-                messagebox.showerror("Error", str(e))
-        threading.Thread(target=worker).start()
+                self.post(messagebox.showerror, "Error", str(e))
+            finally:
+                self.scheduler = None
+        threading.Thread(target=worker, daemon=True).start()
+
+    def cancel_sorting(self):
+        if self.scheduler is None and self.external_cancel is None and self.sweep_cancel is None:
+            return self.log("Nothing to cancel")
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+        for event in (self.external_cancel, self.sweep_cancel):
+            if event is not None:
+                event.set()
+        self.log("🛑 Cancelling...")
+
+    def run_external_sort(self):
+        if self.external_cancel is not None:
+            return messagebox.showwarning("Busy", "An external sort is already running; cancel it first")
+        algorithm = self.chunk_algo_var.get()
+        try:
+            memory_mb = float(self.memory_entry.get() or 64)
+            if memory_mb <= 0:
+                raise ValueError
+        except Exception:
+            return messagebox.showerror("Error", "Enter a memory budget in MB > 0")
+        in_path = filedialog.askopenfilename(filetypes=NUMBER_FILETYPES)
+        if not in_path:
+            return
+        out_path = filedialog.asksaveasfilename(defaultextension=".txt")
+        if not out_path:
+            return
+        self.progress.set(0)
+        def progress(phase, frac):
+            # Splitting is the first half of the bar, merging the second
+            self.post(self.progress.set, frac / 2 if phase == "split" else 0.5 + frac / 2)
+        cancel = self.external_cancel = threading.Event()
+        def worker():
+            # Runs in its own process like the sort jobs, so Cancel can stop it even mid-chunk
+            self.post(self.log, f"🗄️ External sort of {os.path.basename(in_path)} with {algorithm} ({memory_mb:g} MB)")
+            try:
+                kind, payload = run_job(_external_job, (in_path, out_path, algorithm, memory_mb), cancel,
+                                        lambda p: progress(*p))
+                if kind == "cancelled":
+                    with contextlib.suppress(OSError):
+                        os.remove(out_path)  # partial output
+                    self.post(self.log, "🛑 External sort cancelled")
+                elif kind == "done":
+                    self.post(self.progress.set, 1)
+                    self.post(self.log, f"✅ External sort: {payload['count']} numbers, {payload['runs']} runs, {payload['seconds']:.2f}s → {out_path}")
+                else:
+                    self.post(messagebox.showerror, "Error", f"External sort failed: {payload}")
+            finally:
+                self.external_cancel = None
+        threading.Thread(target=worker, daemon=True).start()
+
+    def run_sweep(self):
+        if self.sweep_cancel is not None:
+            return messagebox.showwarning("Busy", "A sweep is already running; cancel it first")
+        selected = [a for a, v in self.algo_vars.items() if v.get()]
+        if not selected:
+            return messagebox.showwarning("No Algorithm", "Select at least one algorithm")
+        try:
+            max_n = int(self.sweep_max_entry.get() or 1000000)
+            budget = float(self.budget_entry.get() or 2)
+            distribution, param = self._distribution()
+            if max_n < 1000 or budget <= 0:
+                raise ValueError
+        except Exception:
+            return messagebox.showerror("Error", "Sweep needs n ≥1000 and a budget > 0")
+        sizes = geometric_sizes(1000, max_n)
+        self.progress.set(0)
+        self.info.delete("1.0", END)
+        def progress(frac, alg, point):
+            self.post(self.log, f"📈 {alg} n={point['size']}: {point['median']:.4f}s")
+            self.post(self.progress.set, frac)
+        def finished(sweep):
+            self.sweep = sweep
+            self.progress.set(1)
+            self.info.insert(END, "\n" + sweep_summary(sweep, max_n * 10) + "\n")
+            draw_scaling(sweep).show()
+        cancel = self.sweep_cancel = threading.Event()
+        def worker():
+            # A spawned job like the sorts: off the GUI's GIL, and Cancel can stop it between or inside sizes
+            self.post(self.log, f"📈 Sweep over {len(sizes)} sizes up to {max_n} ({describe_distribution(distribution, param)})")
+            try:
+                kind, payload = run_job(_sweep_job, (selected, sizes, budget, distribution, param), cancel,
+                                        lambda p: progress(*p))
+                if kind == "done":
+                    self.post(finished, payload)
+                elif kind == "cancelled":
+                    self.post(self.log, "🛑 Sweep cancelled")
+                else:
+                    self.post(messagebox.showerror, "Error", f"Sweep failed: {payload}")
+            except Exception as e:
+                self.post(messagebox.showerror, "Error", f"Sweep failed: {e}")
+            finally:
+                self.sweep_cancel = None
+        threading.Thread(target=worker, daemon=True).start()
 
     def save_sorted_output(self):
-        if not self.sorted_:
+        if len(self.sorted_data) == 0:
             return messagebox.showwarning("No Data", "Nothing sorted yet")
-        path = filedialog.asksaveasfilename(defaultextension=".txt")
+        if self.records is None:
+            return self._save_numbers(self.sorted_data, "Sorted output")
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=RECORD_FILETYPES)
+        if not path:
+            return
+        header, rows, shift = self.records
+        try:
+            write_records(path, header, [rows[i] for i in undecorate(self.sorted_data, shift)])
+            self.log(f"💾 Sorted records saved to {path}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save: {e}")
+
+    def _result_records(self):
+        fingerprint = dataset_fingerprint(self.numbers)
+        return [{"dataset": self.data_source, "size": len(self.numbers), "algorithm": alg, "fingerprint": fingerprint,
+                 "distribution": self.distribution, **st} for alg, st in self.results.items()]
+
+    def show_history(self):
+        try:
+            lines = ["🕘 Recent runs:"]
+            for run in list_runs(limit=10):
+                lines.append(f"  #{run['id']} {run['created']} {run['results']} results ({run['machine_id']}) {run['label'] or ''}")
+            if self.last_run_id is not None:
+                baseline = find_baseline(self.last_run_id)
+                if baseline is None:
+                    lines.append("No earlier run on this dataset to compare against")
+                else:
+                    lines.append(comparison_table(compare_runs(baseline, self.last_run_id), baseline, self.last_run_id))
+            self.info.insert(END, "\n" + "\n".join(lines) + "\n")
+            self.info.see(END)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to read history: {e}")
+
+    def export_results(self):
+        if not self.results:
+            return messagebox.showwarning("No Results", "No results to export")
+        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json"), ("CSV", "*.csv")])
         if path:
+            records = self._result_records()
             try:
-                with open(path, "w") as f:
-                    f.write(" ".join(map(str, self.sorted_data)))
-                self.log(f"💾 Sorted output saved to {path}")
+                write_results(records, path, "csv" if path.lower().endswith(".csv") else "json")
+                self.log(f"📤 Results exported to {path}")
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to save: {e}")
+                messagebox.showerror("Error", f"Failed to export: {e}")
 
-    def plot_results(self):
-        if not self.results:
-            return messagebox.showwarning("No Results", "No sorting results")
+    def _draw_results(self):
         algos = list(self.results.keys())
-        times = [self.results[a] for a in algos]
+        medians = [self.results[a]["median"] for a in algos]
+        errors = [self.results[a]["stddev"] for a in algos]
+        plt = load_pyplot()
         plt.figure(figsize=(8, 6))
-        plt.bar(algos, times, color="skyblue")
-        plt.ylabel("Time (s)")
+        plt.bar(algos, medians, yerr=errors, capsize=4, color="skyblue")
+        plt.ylabel("Median time (s)")
         plt.title("Sorting Performance")
         plt.grid(axis="y")
-        plt.show()
+        return plt
+
+    def plot_results(self):
+        if not self.results:
+            return messagebox.showwarning("No Results", "No sorting results")
+        self._draw_results().show()
 
     def save_graph(self):
         if not self.results:
             return messagebox.showwarning("No Results", "No graph to save")
-        algos = list(self.results.keys())
-        times = [self.results[a] for a in algos]
-        plt.figure(figsize=(8, 6))
-        plt.bar(algos, times, color="skyblue")
-        plt.ylabel("Time (s)")
-        plt.title("Sorting Performance")
-        plt.grid(axis="y")
+        plt = self._draw_results()
         path = filedialog.asksaveasfilename(defaultextension=".png")
         if path:
             try:
@@ -474,8 +2768,266 @@ class SortingApp:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save graph: {e}")
 
-# ----------------- Run App ----------------- #
-if __name__ == "__main__":
+# ----------------- Command Line ----------------- #
+def run_gui():
+    load_gui()
     root = ctk.CTk()
     app = SortingApp(root)
     root.mainloop()
+    if app.scheduler is not None:
+        app.scheduler.cancel()
+    # Sort and external sort jobs are not daemonic, so stop them rather than wait for them at exit
+    for child in multiprocessing.active_children():
+        child.terminate()
+
+def cmd_bench(args):
+    algorithms = resolve_algorithms(args.algorithms)
+    baselines = add_baselines(algorithms)
+    if baselines and not args.quiet:
+        print(f"➕ Added {', '.join(baselines)} as single-core baseline", file=sys.stderr)
+    cache = DatasetCache(disk_dir=args.cache_dir) if args.cache else None
+    if args.sort_workers:
+        set_parallel_workers(args.sort_workers)
+    def load(path):
+        # Record files are benchmarked on their decorated keys, exactly what a record sort runs on
+        if is_records(path):
+            return decorate(load_records(path, args.key)[2])[0]
+        return cache.load(path)[1] if cache else load_numbers(path)
+    datasets = [(os.path.basename(p), load(p)) for p in args.files]
+    dist = describe_distribution(args.distribution, args.param)
+    datasets += [(f"{dist}_{n}", generate_values(n, args.seed, args.distribution, args.param)) for n in args.sizes]
+    generated = {f"{dist}_{n}" for n in args.sizes}
+    if not datasets:
+        raise SystemExit("bench: give at least one --files path or --sizes value")
+    def progress(frac, rec):
+        if not args.quiet:
+            print(f"⚡ {rec['algorithm']} on {rec['dataset']} ({rec['size']}): {format_stats(rec)}", file=sys.stderr)
+    if args.parallel:
+        records = parallel_benchmark(datasets, algorithms, progress, args.repeat, args.warmup, args.jobs,
+                                     memory=args.memory, count_ops=args.count_ops)
+    else:
+        records = benchmark(datasets, algorithms, progress, args.repeat, args.warmup, args.memory, args.count_ops)
+    for rec in records:
+        rec["distribution"] = dist if rec["dataset"] in generated else FILE_DISTRIBUTION
+    write_results(records, args.output, args.format)
+    for name, _ in datasets if not args.quiet else []:
+        speedups = speedup_report({r["algorithm"]: r for r in records if r["dataset"] == name})
+        if speedups:
+            print(f"⚡ {name}\n{speedups}", file=sys.stderr)
+    if not args.no_history:
+        run_id = record_run(records, args.db, args.label)
+        if not args.quiet:
+            print(f"🕘 Stored as run {run_id} in {args.db}", file=sys.stderr)
+
+def cmd_cache(args):
+    cache = DatasetCache(disk_dir=args.cache_dir)
+    if args.action == "clear":
+        cache.clear()
+        print(f"🧹 Cleared {args.cache_dir}")
+    else:
+        files = [os.path.join(args.cache_dir, f) for f in os.listdir(args.cache_dir)]
+        total = sum(os.path.getsize(f) for f in files)
+        print(f"{args.cache_dir}: {len(files)} files, {total / 2**20:.1f} MB (cap {CACHE_DISK_MB} MB)")
+
+def cmd_history(args):
+    if args.action == "list":
+        for run in list_runs(args.db, args.limit):
+            machine = json.loads(run["machine"])
+            print(f"{run['id']:>5}  {run['created']}  {run['results']:>4} results  {machine['node']} ({run['machine_id']})  {run['label'] or ''}")
+    elif args.action == "show":
+        run, results = load_run(args.run or latest_run_id(args.db), args.db)
+        print(f"Run {run['id']} at {run['created']} on {json.loads(run['machine'])}")
+        # (algorithm, dataset) is unique within a run, so no result is dropped
+        print(results_table({f"{r['algorithm']} on {r['dataset']} (n={r['size']})": r for r in results}))
+    else:
+        candidate = args.run or latest_run_id(args.db)
+        baseline = args.baseline or find_baseline(candidate, args.db)
+        if baseline is None:
+            print(f"history: run {candidate} has no earlier run on the same data; pass --baseline", file=sys.stderr)
+            raise SystemExit(EXIT_NO_BASELINE)
+        rows = compare_runs(baseline, candidate, args.db, args.alpha, args.threshold)
+        print(comparison_table(rows, baseline, candidate))
+        if any(r["regression"] for r in rows):
+            raise SystemExit(EXIT_REGRESSION)
+
+def cmd_external(args):
+    algorithm = resolve_algorithms([args.algorithm])[0]
+    def progress(phase, frac):
+        if not args.quiet:
+            print(f"\r🗄️ {phase}: {frac:6.1%}", end="", file=sys.stderr, flush=True)
+    info = external_sort(args.input, args.output, algorithm, args.memory, progress, args.tmp_dir)
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(f"✅ Sorted {info['count']} numbers in {info['runs']} runs with {algorithm} in {info['seconds']:.2f}s")
+
+def cmd_verify(args):
+    numbers, output = load_numbers(args.input, as_array=np is not None), load_numbers(args.output, as_array=np is not None)
+    print(f"📥 input: {len(numbers)} numbers, {format_presortedness(presortedness(numbers))}")
+    result = verify_sort(output, multiset_hash(numbers))
+    if result["verified"]:
+        print(f"✅ {args.output} is a sorted permutation of {args.input}")
+    else:
+        problems = [p for p, ok in (("not non-decreasing", result["ordered"]), ("not a permutation of the input", result["permutation"])) if not ok]
+        raise SystemExit(f"❌ {args.output}: " + ", ".join(problems))
+
+def cmd_sort(args):
+    algorithm = resolve_algorithms([args.algorithm])[0]
+    func, start = SORT_FUNCTIONS[algorithm], time.perf_counter()
+    if is_records(args.input):
+        header, rows, keys = load_records(args.input, args.key)
+        write_records(args.output, header, sort_records(func, rows, keys))
+        what = f"{len(rows)} records by column {args.key!r}"
+    else:
+        numbers = load_numbers(args.input)
+        save_numbers(args.output, func(getattr(func, "prepare", as_list)(numbers)))
+        what = f"{len(numbers)} {number_dtype(numbers)} numbers"
+    print(f"✅ Sorted {what} with {algorithm} ({stability_label(algorithm)}) in {time.perf_counter() - start:.2f}s → {args.output}")
+
+def cmd_convert(args):
+    count = convert_file(args.input, args.output, args.dtype)
+    print(f"✅ Converted {count} numbers: {args.input} → {args.output}")
+
+def cmd_info(args):
+    with open(args.path, "rb") as f:
+        header = read_binary_header(f)
+    print(f"{args.path}: {header['count']} x {header['dtype']}, {'sorted' if header['sorted'] else 'unsorted'}")
+
+def cmd_generate(args):
+    def progress(frac, path, count):
+        if not args.quiet:
+            print(f"📁 {os.path.basename(path)}: {count} numbers", file=sys.stderr)
+    seed, files = generate_corpus(args.folder, args.files, args.count, args.seed, args.format, args.step, args.jobs, progress,
+                                  args.distribution, args.param)
+    print(f"✅ {len(files)} files written to {args.folder} (seed {seed})")
+
+def cmd_sweep(args):
+    algorithms = resolve_algorithms(args.algorithms)
+    sizes = geometric_sizes(args.min, args.max, args.per_decade)
+    def progress(frac, alg, point):
+        if not args.quiet:
+            print(f"📈 {alg} n={point['size']}: {point['median']:.4f}s", file=sys.stderr)
+    sweep = scaling_sweep(algorithms, sizes, args.budget, args.distribution, args.param, args.seed,
+                          args.repeat, args.warmup, progress)
+    print(sweep_summary(sweep, args.predict), file=sys.stderr)
+    if args.format == "csv":
+        dist = describe_distribution(args.distribution, args.param)
+        rows = [{"dataset": f"{dist}_{p['size']}", "algorithm": alg, **p} for alg, res in sweep.items() for p in res["points"]]
+        write_results(rows, args.output, "csv")
+    else:
+        write_results(sweep, args.output, "json")
+    if args.plot:
+        draw_scaling(sweep).savefig(args.plot)
+
+def add_distribution_args(p):
+    params = ", ".join(f"{d}: {name}={default}" for d, (_, name, default) in DISTRIBUTIONS.items() if name)
+    p.add_argument("-d", "--distribution", choices=list(DISTRIBUTIONS), default="uniform", help="shape of generated input")
+    p.add_argument("--param", type=float, help=f"distribution parameter ({params})")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="Sorter2.py", description="Sorting dashboard and headless benchmark runner")
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("gui", help="launch the GUI dashboard (default)")
+    p = sub.add_parser("bench", help="time sorting algorithms without the GUI")
+    p.add_argument("--files", nargs="+", default=[], help="number files, or CSV/TSV record files sorted by --key")
+    p.add_argument("--key", default="0", help="key column (name or index) for record files (default: 0)")
+    p.add_argument("--sizes", nargs="+", type=int, default=[], help="sizes of random datasets to generate")
+    add_distribution_args(p)
+    p.add_argument("--seed", type=int, help="seed for the generated datasets")
+    p.add_argument("-a", "--algorithms", nargs="+", help="algorithms to run (default: all), e.g. merge quick")
+    p.add_argument("-r", "--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per algorithm")
+    p.add_argument("-w", "--warmup", type=int, default=DEFAULT_WARMUP, help="untimed warmup runs per algorithm")
+    p.add_argument("-m", "--memory", action="store_true", help="also profile peak memory and GC runs (extra untimed run)")
+    p.add_argument("-c", "--count-ops", action="store_true", help="also count comparisons and element writes (extra untimed run)")
+    p.add_argument("-p", "--parallel", action="store_true", help="run (algorithm, dataset) jobs in a process pool")
+    p.add_argument("-j", "--jobs", type=int, help="pool size for --parallel (default: CPU count)")
+    p.add_argument("--sort-workers", type=int, help="worker processes inside each parallel sort (default: CPU count)")
+    p.add_argument("-f", "--format", choices=["json", "csv"], default="json")
+    p.add_argument("-o", "--output", default="-", help="results file (default: stdout)")
+    p.add_argument("-q", "--quiet", action="store_true", help="no per-run progress on stderr")
+    p.add_argument("--cache", action="store_true", help="reuse parsed --files from the on-disk dataset cache")
+    p.add_argument("--cache-dir", default=CACHE_DIR, help=f"dataset cache directory (default: {CACHE_DIR})")
+    p.add_argument("--db", default=HISTORY_DB, help=f"history database (default: {HISTORY_DB})")
+    p.add_argument("--label", help="label stored with this run in the history database")
+    p.add_argument("--no-history", action="store_true", help="do not store this run in the history database")
+    p.set_defaults(func=cmd_bench)
+    p = sub.add_parser("cache", help="inspect or clear the on-disk dataset cache")
+    p.add_argument("action", choices=["info", "clear"])
+    p.add_argument("--cache-dir", default=CACHE_DIR)
+    p.set_defaults(func=cmd_cache)
+    p = sub.add_parser("history", help="list stored benchmark runs and flag regressions against a baseline",
+                       epilog=f"compare exits {EXIT_REGRESSION} on a regression and {EXIT_NO_BASELINE} when no baseline run is found")
+    p.add_argument("action", choices=["list", "show", "compare"])
+    p.add_argument("run", nargs="?", type=int, help="run id (default: latest)")
+    p.add_argument("--baseline", type=int, help="baseline run id for compare (default: previous run on the same data)")
+    p.add_argument("--alpha", type=float, default=REGRESSION_ALPHA, help="significance level of the Mann-Whitney test")
+    p.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="minimum median slowdown to flag, e.g. 0.05")
+    p.add_argument("--limit", type=int, default=20)
+    p.add_argument("--db", default=HISTORY_DB)
+    p.set_defaults(func=cmd_history)
+    p = sub.add_parser("external", help="sort a number file larger than RAM with an external merge sort")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("-a", "--algorithm", default="Merge Sort", help="algorithm used to sort each in-memory chunk")
+    p.add_argument("-m", "--memory", type=float, default=64, help="memory budget in MB (default: 64)")
+    p.add_argument("--tmp-dir", help="directory for spilled runs (default: system temp)")
+    p.add_argument("-q", "--quiet", action="store_true", help="no progress on stderr")
+    p.set_defaults(func=cmd_external)
+    p = sub.add_parser("sweep", help="time algorithms over a geometric series of sizes and fit their scaling")
+    p.add_argument("-a", "--algorithms", nargs="+", help="algorithms to run (default: all)")
+    p.add_argument("--min", type=int, default=1000, help="smallest size (default: 1000)")
+    p.add_argument("--max", type=int, default=10**7, help="largest size (default: 10000000)")
+    p.add_argument("--per-decade", type=int, default=2, help="sizes per factor of 10 (default: 2)")
+    p.add_argument("-b", "--budget", type=float, default=5.0, help="seconds per run after which an algorithm stops growing")
+    p.add_argument("-r", "--repeat", type=int, default=3)
+    p.add_argument("-w", "--warmup", type=int, default=0)
+    add_distribution_args(p)
+    p.add_argument("--seed", type=int)
+    p.add_argument("--predict", type=int, help="print the fitted runtime at this size")
+    p.add_argument("--plot", help="save the log-log scaling chart to this PNG")
+    p.add_argument("-f", "--format", choices=["json", "csv"], default="json")
+    p.add_argument("-o", "--output", default="-")
+    p.add_argument("-q", "--quiet", action="store_true")
+    p.set_defaults(func=cmd_sweep)
+    p = sub.add_parser("generate", help="write a corpus of random number files in parallel")
+    p.add_argument("folder")
+    p.add_argument("-n", "--files", type=int, default=3)
+    p.add_argument("-c", "--count", type=int, default=10000, help="numbers in the first file")
+    p.add_argument("--step", type=int, default=GEN_STEP, help="extra numbers per subsequent file")
+    p.add_argument("--seed", type=int, help="base seed; the same seed reproduces the same files")
+    p.add_argument("--format", choices=["txt", "nsb"], default="txt")
+    add_distribution_args(p)
+    p.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    p.add_argument("-q", "--quiet", action="store_true", help="no per-file progress on stderr")
+    p.set_defaults(func=cmd_generate)
+    p = sub.add_parser("sort", help="sort a number file, or a CSV/TSV record file by a key column")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("-a", "--algorithm", default="Hybrid Sort")
+    p.add_argument("--key", default="0", help="key column (name or index) for record files (default: 0)")
+    p.set_defaults(func=cmd_sort)
+    p = sub.add_parser("verify", help="check that OUTPUT is a sorted permutation of INPUT and describe INPUT's order")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.set_defaults(func=cmd_verify)
+    p = sub.add_parser("convert", help=f"convert between text and binary ({BINARY_EXT}) number files")
+    p.add_argument("input")
+    p.add_argument("output")
+    p.add_argument("--dtype", choices=list(BINARY_DTYPES), default="int64", help="element type for binary output")
+    p.set_defaults(func=cmd_convert)
+    p = sub.add_parser("info", help=f"show the header of a binary ({BINARY_EXT}) number file")
+    p.add_argument("path")
+    p.set_defaults(func=cmd_info)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if getattr(args, "func", None) is None:
+        return run_gui()
+    try:
+        args.func(args)
+    except ValueError as e:
+        raise SystemExit(f"{args.command}: {e}")
+
+# ----------------- Run App ----------------- #
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import importlib, os, sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture(scope="session", params=["numpy", "pure"])
+def S(request):
+    # Sorter2 picks its engines at import time, so each mode imports a fresh copy; "pure" blocks numpy first.
+    # It is registered as "Sorter2" while in use so the parallel sorts' pool can pickle its functions.
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    original, numpy = sys.modules.pop("Sorter2", None), sys.modules.get("numpy")
+    if request.param == "pure":
+        sys.modules["numpy"] = None
+    try:
+        module = importlib.import_module("Sorter2")
+    finally:
+        if request.param == "pure":
+            if numpy is None:
+                del sys.modules["numpy"]
+            else:
+                sys.modules["numpy"] = numpy
+    with pytest.MonkeyPatch.context() as mp:
+        # Two workers and a low cut-off, so small inputs still take the parallel path
+        mp.setenv(module.PARALLEL_WORKERS_ENV, "2")
+        mp.setattr(module, "PARALLEL_MIN", 64)
+        yield module
+        module.shutdown_parallel_pool()
+    sys.modules.pop("Sorter2", None)
+    if original is not None:
+        sys.modules["Sorter2"] = original
@@ -0,0 +1,18 @@
+import random
+
+rng = random.Random(2024)
+INPUTS = {
+    "empty": [],
+    "single": [7],
+    "negative": [rng.randint(-10**6, 10**6) for _ in range(300)],
+    "extremes": [2**63 - 1, -2**63, 0, -1, 1, 2**62, -2**62],
+    "floats": [rng.uniform(-1e6, 1e6) for _ in range(300)] + [0.0, -0.0, 1e-300, -1e300],
+    "duplicates": [rng.randint(-3, 3) for _ in range(300)],
+    "presorted": sorted(rng.randint(0, 10**9) for _ in range(300)),
+    "reversed": sorted((rng.randint(0, 10**9) for _ in range(300)), reverse=True),
+}
+INT_INPUTS = [name for name in INPUTS if name != "floats"]
+
+def run_sort(S, alg, data):
+    func = S.SORT_FUNCTIONS[alg]
+    return S.as_list(func(getattr(func, "prepare", S.as_list)(list(data))))
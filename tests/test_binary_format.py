@@ -0,0 +1,40 @@
+import pytest
+
+from inputs import INPUTS, rng
+
+@pytest.mark.parametrize("dtype,values", [
+    ("int64", INPUTS["negative"] + INPUTS["extremes"]),
+    ("uint32", [rng.randint(0, 2**32 - 1) for _ in range(200)]),
+    ("float64", INPUTS["floats"]),
+])
+def test_round_trip(S, tmp_path, dtype, values):
+    path = str(tmp_path / ("data" + S.BINARY_EXT))
+    for data, is_sorted in ((values, False), (sorted(values), True)):
+        assert S.write_binary(path, data, dtype, batch=64) == len(data)
+        loaded, header = S.load_binary(path)
+        assert S.as_list(loaded) == data
+        assert header == {"dtype": dtype, "count": len(data), "sorted": is_sorted}
+
+def test_rejects_other_files(S, tmp_path):
+    path = tmp_path / "data.nsb"
+    path.write_bytes(b"1 2 3 4 5 6 7 8 9 10 11 12")
+    with pytest.raises(ValueError):
+        S.load_binary(str(path))
+    with pytest.raises(ValueError):
+        S.write_binary(str(path), [2**40], "uint32")
+
+def test_convert_round_trip(S, tmp_path):
+    txt, nsb, back = (str(tmp_path / f) for f in ("a.txt", "a.nsb", "b.txt"))
+    S.write_numbers(txt, INPUTS["negative"])
+    S.convert_file(txt, nsb)
+    assert S.load_binary(nsb)[1]["dtype"] == "int64"
+    S.convert_file(nsb, back)
+    assert S.load_numbers(back) == INPUTS["negative"]
+
+def test_external_sort_writes_binary(S, tmp_path):
+    src, dst = str(tmp_path / "in.txt"), str(tmp_path / "out.nsb")
+    S.write_numbers(src, INPUTS["floats"])
+    S.external_sort(src, dst, "Merge Sort", memory_mb=0.01)
+    values, header = S.load_binary(dst)
+    assert header["dtype"] == "float64" and header["sorted"]
+    assert S.as_list(values) == sorted(INPUTS["floats"])
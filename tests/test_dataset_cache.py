@@ -0,0 +1,17 @@
+STATS = {"median": 1.0}
+
+def test_timings_persist_per_machine(S, tmp_path):
+    S.DatasetCache(str(tmp_path)).put_timing("k", "Quick Sort", 3, 1, STATS)
+    assert S.DatasetCache(str(tmp_path)).get_timing("k", "Quick Sort", 3, 1) == STATS
+    other = S.DatasetCache(str(tmp_path))
+    other.machine_id = "elsewhere"
+    assert other.get_timing("k", "Quick Sort", 3, 1) is None
+
+def test_parallel_timings_keyed_by_workers(S, tmp_path, monkeypatch):
+    cache = S.DatasetCache(str(tmp_path))
+    monkeypatch.setenv(S.PARALLEL_WORKERS_ENV, "2")
+    cache.put_timing("k", "Parallel Sample Sort", 3, 1, STATS)
+    cache.put_timing("k", "Quick Sort", 3, 1, STATS)
+    monkeypatch.setenv(S.PARALLEL_WORKERS_ENV, "4")
+    assert cache.get_timing("k", "Parallel Sample Sort", 3, 1) is None
+    assert cache.get_timing("k", "Quick Sort", 3, 1) == STATS
@@ -0,0 +1,17 @@
+from inputs import rng
+
+def test_spills_runs_and_merges(S, tmp_path):
+    values = [rng.randint(-10**9, 10**9) for _ in range(5000)]
+    src, dst = str(tmp_path / "in.txt"), str(tmp_path / "sorted.txt")
+    S.write_numbers(src, values)
+    phases = set()
+    info = S.external_sort(src, dst, "Hybrid Sort", memory_mb=0.05, progress=lambda phase, frac: phases.add(phase))
+    assert info["runs"] > 1 and info["count"] == len(values)
+    assert phases == {"split", "merge"}
+    assert S.load_numbers(dst) == sorted(values)
+
+def test_single_chunk(S, tmp_path):
+    src, dst = str(tmp_path / "in.txt"), str(tmp_path / "sorted.txt")
+    S.write_numbers(src, [3, -1, 2])
+    assert S.external_sort(src, dst, "Merge Sort")["runs"] == 1
+    assert S.load_numbers(dst) == [-1, 2, 3]
@@ -0,0 +1,50 @@
+from inputs import INPUTS
+
+def record(S, db, numbers, dataset, distribution, samples):
+    stats = S.summarize(samples)
+    return S.record_run([{"dataset": dataset, "size": len(numbers), "algorithm": "Merge Sort", "distribution": distribution,
+                          "fingerprint": S.dataset_fingerprint(numbers), **stats}], db)
+
+def test_fingerprint_ignores_container(S):
+    values = INPUTS["floats"]
+    assert S.dataset_fingerprint(values) != S.dataset_fingerprint([int(x) for x in values])
+    if S.np is not None:
+        assert S.dataset_fingerprint(S.np.array(values)) == S.dataset_fingerprint(values)
+        assert S.dataset_fingerprint(S.np.arange(5, dtype=S.np.uint32)) == S.dataset_fingerprint(list(range(5)))
+
+def test_fingerprint_matches_binary_file(S, tmp_path):
+    txt, nsb = str(tmp_path / "a.txt"), str(tmp_path / "a.nsb")
+    S.write_numbers(txt, INPUTS["negative"])
+    S.convert_file(txt, nsb)
+    assert S.dataset_fingerprint(S.load_numbers(nsb)) == S.dataset_fingerprint(S.load_numbers(txt))
+
+def test_mann_whitney(S):
+    base = [1.0 + 0.01 * i for i in range(10)]
+    assert S.mann_whitney_greater(base, [2.0 + 0.01 * i for i in range(10)]) < 0.01
+    assert S.mann_whitney_greater(base, base) > 0.4
+    assert S.mann_whitney_greater([2.0 + 0.01 * i for i in range(10)], base) > 0.99
+    assert S.mann_whitney_greater([1.0], base) is None
+
+def test_baseline_by_fingerprint_flags_regression(S, tmp_path):
+    db = str(tmp_path / "h.sqlite")
+    base = record(S, db, INPUTS["negative"], "a.txt", "file", [1_000_000_000 + i for i in range(10)])
+    cand = record(S, db, INPUTS["negative"], "a.txt", "file", [2_000_000_000 + i for i in range(10)])
+    assert S.find_baseline(cand, db) == base
+    [row] = S.compare_runs(base, cand, db)
+    assert row["regression"] and row["ratio"] > 1.9
+    assert S.find_baseline(base, db) is None
+
+def test_generated_data_falls_back_to_shape(S, tmp_path):
+    db = str(tmp_path / "h.sqlite")
+    samples = [1_000_000_000 + i for i in range(10)]
+    base = record(S, db, INPUTS["negative"], "uniform_300", "uniform", samples)
+    cand = record(S, db, INPUTS["reversed"], "uniform_300", "uniform", samples)
+    assert S.find_baseline(cand, db) == base
+    assert len(S.compare_runs(base, cand, db)) == 1
+
+def test_files_never_match_by_shape(S, tmp_path):
+    db = str(tmp_path / "h.sqlite")
+    base = record(S, db, INPUTS["presorted"], "a.txt", S.FILE_DISTRIBUTION, [1_000_000 + i for i in range(10)])
+    cand = record(S, db, INPUTS["negative"], "b.txt", S.FILE_DISTRIBUTION, [900_000_000 + i for i in range(10)])
+    assert S.find_baseline(cand, db) is None
+    assert S.compare_runs(base, cand, db) == []
@@ -0,0 +1,26 @@
+import pytest
+
+from inputs import INPUTS, rng, run_sort
+
+def test_registered(S):
+    assert S.SORT_FUNCTIONS["Hybrid Sort"] is S.hybrid_sort
+
+@pytest.mark.parametrize("name", INPUTS)
+def test_matches_sorted(S, name):
+    assert run_sort(S, "Hybrid Sort", INPUTS[name]) == sorted(INPUTS[name])
+
+@pytest.mark.parametrize("depth", [0, 1, 3])
+def test_introsort_heapsort_fallback(S, depth):
+    a = [rng.randint(-50, 50) for _ in range(500)]
+    expected = sorted(a)
+    S.introsort(a, 0, len(a), depth)
+    assert a == expected
+
+def test_merges_presorted_runs(S):
+    a = INPUTS["negative"]
+    data = sorted(a[:100]) + sorted(a[100:], reverse=True) + sorted(a[:50])
+    assert S.find_runs(list(data), len(data) // S.HYBRID_MIN_RUN) is not None
+    assert S.hybrid_sort(data) == sorted(data)
+
+def test_random_input_skips_run_merging(S):
+    assert S.find_runs(list(INPUTS["negative"]), len(INPUTS["negative"]) // S.HYBRID_MIN_RUN) is None
@@ -0,0 +1,35 @@
+import pytest
+
+from inputs import INPUTS, INT_INPUTS
+
+def inplace_algorithms(S):
+    return [name for name, func in S.SORT_FUNCTIONS.items() if hasattr(func, "inplace")]
+
+def test_pure_sorts_have_inplace_entry_points(S):
+    assert {"Bubble Sort", "Insertion Sort", "Selection Sort", "Merge Sort", "Quick Sort", "Radix Sort",
+            "Hybrid Sort"} <= set(inplace_algorithms(S))
+
+@pytest.mark.parametrize("name", INT_INPUTS)
+def test_inplace_matches_public_sort(S, name):
+    for alg in inplace_algorithms(S):
+        func = S.SORT_FUNCTIONS[alg]
+        prepare = getattr(func, "prepare", S.as_list)
+        assert S.as_list(func.inplace(prepare(INPUTS[name]))) == sorted(INPUTS[name]), alg
+
+def test_public_sorts_leave_input_alone(S):
+    for alg in inplace_algorithms(S):
+        func = S.SORT_FUNCTIONS[alg]
+        data = getattr(func, "prepare", S.as_list)(INPUTS["reversed"])
+        before = S.as_list(data)
+        func(data)
+        assert S.as_list(data) == before, alg
+
+def test_time_sort_uses_inplace_entry_point(S, monkeypatch):
+    seen = []
+    func = S.SORT_FUNCTIONS["Insertion Sort"]
+    monkeypatch.setattr(func, "inplace", lambda a: seen.append(a) or sorted(a))
+    numbers = list(INPUTS["reversed"])
+    stats, result = S.time_sort(func, numbers, repeat=2, warmup=1)
+    assert stats["verified"] and result == sorted(numbers)
+    assert len(seen) == 3 and all(a is not numbers for a in seen)
+    assert numbers == INPUTS["reversed"]
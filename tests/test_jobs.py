@@ -0,0 +1,15 @@
+import threading
+
+def test_sweep_job_reports_points(S):
+    seen = []
+    kind, sweep = S.run_job(S._sweep_job, (["Quick Sort"], [200, 400], 5.0, "uniform", None), threading.Event(),
+                            seen.append)
+    assert kind == "done" and [p["size"] for p in sweep["Quick Sort"]["points"]] == [200, 400]
+    assert [(alg, point["size"]) for _, alg, point in seen] == [("Quick Sort", 200), ("Quick Sort", 400)]
+
+def test_cancelled_job_is_stopped(S):
+    cancel = threading.Event()
+    def progress(_):
+        cancel.set()  # cancel as soon as the first size is timed, long before the last one finishes
+    kind, payload = S.run_job(S._sweep_job, (["Bubble Sort"], [200, 10**6], 10**6, "uniform", None), cancel, progress)
+    assert (kind, payload) == ("cancelled", None)
@@ -0,0 +1,27 @@
+import pytest
+
+from inputs import INPUTS, run_sort
+
+@pytest.mark.parametrize("name", INPUTS)
+@pytest.mark.parametrize("alg", ["Merge Sort", "Radix Sort"])
+def test_matches_sorted(S, alg, name):
+    assert run_sort(S, alg, INPUTS[name]) == sorted(INPUTS[name])
+
+@pytest.mark.parametrize("left,right", [
+    ([1, 2, 3], [7, 8, 9]),         # right side left over
+    ([7, 8, 9], [1, 2, 3]),         # left side left over
+    ([1, 4, 4, 9], [2, 4, 5]),
+])
+def test_merge_into_copies_leftovers(S, left, right):
+    src, dst = left + right, [None] * (len(left) + len(right))
+    S.merge_into(src, dst, 0, len(left), len(src))
+    assert dst == sorted(src)
+
+def test_merge_runs_carries_odd_run(S):
+    a = [5, 6, 7, 1, 2, 3, 0, 4]
+    assert S.merge_runs(list(a), [0, 3, 6, 8]) == sorted(a)
+
+def test_counting_sort_reuses_output_buffer(S):
+    a, buf = [21, 13, 5, 40], [0] * 4
+    assert S.counting_sort(a, 1, buf) is buf
+    assert buf == [40, 21, 13, 5]
@@ -0,0 +1,31 @@
+import pytest
+
+from inputs import INPUTS
+
+@pytest.mark.parametrize("name", ["negative", "floats", "extremes", "empty"])
+def test_text_round_trip(S, tmp_path, name):
+    values, path = INPUTS[name], str(tmp_path / "data.txt")
+    S.write_numbers(path, values, batch=32)
+    assert S.load_numbers(path) == values
+    # Tiny blocks split tokens across block boundaries
+    assert S.join_blocks(list(S.iter_number_blocks(path, block_size=7))) == values
+
+def test_mixed_blocks_promote_to_float(S, tmp_path):
+    path = tmp_path / "mixed.txt"
+    path.write_text("1 2 3 4 5 6 7 8 2.5 -1")
+    assert S.join_blocks(list(S.iter_number_blocks(str(path), block_size=4))) == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 2.5, -1.0]
+
+def test_chunks_respect_max_count(S, tmp_path):
+    path = str(tmp_path / "data.txt")
+    S.write_numbers(path, INPUTS["negative"])
+    chunks = [S.as_list(c) for c in S.read_number_chunks(path, 64, block_size=100)]
+    assert all(len(c) <= 64 for c in chunks)
+    assert [x for c in chunks for x in c] == INPUTS["negative"]
+
+def test_array_parse_rejects_values_beyond_int64(S, tmp_path):
+    path = tmp_path / "big.txt"
+    path.write_text(f"1 {2**70} 3")
+    assert S.load_numbers(str(path)) == [1, 2**70, 3]
+    if S.np is not None:
+        with pytest.raises(ValueError, match="int64"):
+            S.load_numbers(str(path), as_array=True)
@@ -0,0 +1,29 @@
+import pytest
+
+from inputs import INPUTS, run_sort
+
+NUMPY_SORTS = ["NumPy Radix Sort", "NumPy Merge Sort", "NumPy Sort (quick)", "NumPy Sort (stable)"]
+
+@pytest.fixture
+def N(S):
+    if S.np is None:
+        pytest.skip("NumPy engine not available")
+    return S
+
+def test_registered_only_with_numpy(S):
+    assert all((alg in S.SORT_FUNCTIONS) == (S.np is not None) for alg in NUMPY_SORTS)
+
+@pytest.mark.parametrize("name", INPUTS)
+@pytest.mark.parametrize("alg", NUMPY_SORTS)
+def test_matches_sorted(N, alg, name):
+    assert run_sort(N, alg, INPUTS[name]) == sorted(INPUTS[name])
+
+def test_merge_sort_spans_blocks(N, monkeypatch):
+    # Small blocks force the bulk merges between sorted blocks
+    monkeypatch.setattr(N, "NP_MERGE_BLOCK", 16)
+    data = INPUTS["negative"]
+    assert N.np_merge_sort(N.to_array(data)).tolist() == sorted(data)
+
+def test_to_array_rejects_wide_ints(N):
+    with pytest.raises(ValueError):
+        N.to_array([2**70, 1])
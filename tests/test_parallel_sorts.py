@@ -0,0 +1,34 @@
+import pytest
+
+from inputs import INPUTS, rng, run_sort
+
+PARALLEL_SORTS = ["Parallel Merge Sort", "Parallel Sample Sort"]
+
+@pytest.mark.parametrize("name", INPUTS)
+@pytest.mark.parametrize("alg", PARALLEL_SORTS)
+def test_matches_sorted(S, alg, name):
+    assert run_sort(S, alg, INPUTS[name]) == sorted(INPUTS[name])
+
+@pytest.mark.parametrize("alg", PARALLEL_SORTS)
+def test_skewed_buckets(S, alg):
+    data = [0] * 500 + [rng.randint(-5, 5) for _ in range(100)]
+    assert run_sort(S, alg, data) == sorted(data)
+
+def test_workers_from_environment(S, monkeypatch):
+    monkeypatch.setenv(S.PARALLEL_WORKERS_ENV, "2")  # restored afterwards, set_parallel_workers writes os.environ
+    S.set_parallel_workers(3)
+    assert S.parallel_workers() == 3
+    S.set_parallel_workers(0)
+    assert S.parallel_workers() == 1
+
+def test_speedup_report(S):
+    base = S.PARALLEL_BASELINES["Parallel Merge Sort"]
+    report = S.speedup_report({"Parallel Merge Sort": {"median": 1.0}, base: {"median": 3.0}}, 4)
+    assert report == f"Parallel Merge Sort: 3.00x over {base} on 4 workers (75% efficiency)"
+    assert S.speedup_report({"Parallel Merge Sort": {"median": 1.0}}, 4) == ""
+
+def test_add_baselines(S):
+    algorithms = ["Parallel Sample Sort", "Merge Sort"]
+    assert S.add_baselines(algorithms) == [S.PARALLEL_BASELINES["Parallel Sample Sort"]]
+    assert algorithms[-1] == S.PARALLEL_BASELINES["Parallel Sample Sort"]
+    assert S.add_baselines(algorithms) == []
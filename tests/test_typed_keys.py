@@ -0,0 +1,46 @@
+import pytest
+
+from inputs import INPUTS, rng, run_sort
+
+@pytest.mark.parametrize("name", ["negative", "extremes", "floats", "duplicates"])
+def test_every_algorithm_sorts_signed_and_float_input(S, name):
+    data = INPUTS[name]
+    for alg in S.SORT_FUNCTIONS:
+        assert run_sort(S, alg, data) == sorted(data), alg
+
+def test_radix_keys_preserve_order(S):
+    for name in ("negative", "floats", "extremes"):
+        values = INPUTS[name]
+        keys, restore = S.radix_keys(list(values))
+        assert min(keys) >= 0
+        assert [v for _, v in sorted(zip(keys, values))] == sorted(values)
+        assert (restore(keys) if restore else keys) == values
+
+@pytest.mark.parametrize("name", ["negative", "floats", "duplicates", "extremes"])
+def test_decorate_undecorate(S, name):
+    keys = INPUTS[name]
+    packed, shift = S.decorate(keys)
+    assert all(0 <= p < 2**63 for p in packed)
+    assert S.undecorate(packed, shift) == list(range(len(keys)))
+    assert S.undecorate(sorted(packed), shift) == sorted(range(len(keys)), key=keys.__getitem__)
+
+def test_record_sort_is_stable_for_every_algorithm(S):
+    keys = [rng.choice([1.5, -2.0, 3.25]) for _ in range(120)]
+    rows = [[str(k), str(i)] for i, k in enumerate(keys)]
+    expected = sorted(rows, key=lambda row: float(row[0]))
+    for alg in S.SORT_FUNCTIONS:
+        assert S.sort_records(S.SORT_FUNCTIONS[alg], rows, keys) == expected, alg
+
+def test_load_and_write_records(S, tmp_path):
+    src, dst = tmp_path / "p.csv", str(tmp_path / "o.csv")
+    src.write_text("name,price\na,2.5\nb,-1\nc,2.5\nd,0\n")
+    header, rows, keys = S.load_records(str(src), "price")
+    assert header == ["name", "price"] and keys == [2.5, -1.0, 2.5, 0.0]
+    S.write_records(dst, header, S.sort_records(S.radix_sort, rows, keys))
+    assert open(dst).read().split() == ["name,price", "b,-1", "d,0", "a,2.5", "c,2.5"]
+    with pytest.raises(ValueError):
+        S.load_records(str(src), "name")
+
+def test_count_operations_on_floats_and_negatives(S):
+    assert S.count_operations(S.merge_sort, [2.7, 2.2, 1.5]) != S.count_operations(S.merge_sort, [2, 2, 1])
+    assert S.count_operations(S.radix_sort, [5, -3, 2])["writes"] > 0
@@ -0,0 +1,32 @@
+from inputs import INPUTS, rng
+
+def test_multiset_hash(S):
+    values = INPUTS["negative"] + INPUTS["floats"]
+    shuffled = values[:]
+    rng.shuffle(shuffled)
+    assert S.multiset_hash(shuffled) == S.multiset_hash(values)
+    assert S.multiset_hash([values[0] + 1] + values[1:]) != S.multiset_hash(values)
+    assert S.multiset_hash([-0.0, 1.0]) == S.multiset_hash([0.0, 1.0])
+    assert S.multiset_hash([2**70, 1]) == S.multiset_hash([1, 2**70])
+    if S.np is not None:
+        assert S.multiset_hash(S.np.array(values)) == S.multiset_hash(values)
+
+def test_verify_sort(S):
+    data = INPUTS["duplicates"]
+    h = S.multiset_hash(data)
+    assert S.verify_sort(sorted(data), h) == {"verified": True, "ordered": True, "permutation": True}
+    assert not S.verify_sort(data, h)["ordered"]
+    assert not S.verify_sort(sorted(data)[:-1], h)["permutation"]
+
+def test_first_difference(S):
+    assert S.first_difference([1, 2, 3], [1, 2, 3]) is None
+    assert S.first_difference([1, 5, 3], [1, 2, 3]) == 1
+    assert S.first_difference([1, 2], [1, 2, 3]) == 2
+
+def test_presortedness(S):
+    assert S.presortedness(INPUTS["presorted"])["inversions"] == 0
+    assert S.presortedness(INPUTS["presorted"])["runs"] == 1
+    assert S.presortedness(INPUTS["reversed"])["inversion_ratio"] == 1.0
+    assert S.count_inversions([3, 1, 2]) == 2
+    data = INPUTS["negative"][:200]
+    assert S.count_inversions(data) == sum(a > b for i, a in enumerate(data) for b in data[i + 1:])